@@ -1,15 +1,35 @@
 #!/usr/bin/env python3
+import hashlib
 import json
 import os
-from copy import deepcopy
+import sys
+from pathlib import Path
+from types import MappingProxyType
 
-CONFIG_FILE = os.path.join(os.path.dirname(__file__), "devcontainer.env.json")
-DEVCONTAINER_FILE = os.path.join(os.path.dirname(__file__), "devcontainer.json")
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+CONFIG_FILE = SCRIPT_DIR / "devcontainer.env.json"
+DEVCONTAINER_FILE = SCRIPT_DIR / "devcontainer.json"
+CACHE_FILE = SCRIPT_DIR / ".devcontainer.cache"
 
 FEATURE_LANGUAGE_KEYS = ["python", "java", "node", "ruby", "php", "rust", "typescript", "javascript", "go"]
 FALLBACK_LANGUAGE_KEYS = ["csharp", "kotlin", "c", "cpp"]
 
-DEFAULT_CONFIG = {
+BOOL_STRINGS = {True: "true", False: "false"}
+
+SUMMARY_SECTIONS = (
+    ("CI/CD Tools", "cicd"),
+    ("Kubernetes Tools", "kubernetes"),
+    ("Build Tools", "build_tools"),
+    ("Code Analysis Tools", "code_analysis"),
+    ("DevOps Tools", "devops_tools"),
+)
+
+_DEFAULT_CONFIG = {
     "languages": {
         "python": True,
         "java": True,
@@ -80,59 +100,137 @@ DEFAULT_CONFIG = {
     },
 }
 
-
-BUILD_ARG_FACTORIES = {
-    "INSTALL_CSHARP": lambda c: c["languages"]["csharp"],
-    "INSTALL_KOTLIN": lambda c: c["languages"]["kotlin"],
-    "INSTALL_C": lambda c: c["languages"]["c"],
-    "INSTALL_CPP": lambda c: c["languages"]["cpp"],
-    "INSTALL_DOCKER": lambda c: c["cicd"]["docker"],
-    "INSTALL_PODMAN": lambda c: c["cicd"].get("podman", False),
-    "INSTALL_TERRAFORM": lambda c: c["cicd"]["terraform"],
-    "INSTALL_KUBECTL": lambda c: c["cicd"]["kubectl"],
-    "INSTALL_HELM": lambda c: c["cicd"]["helm"],
-    "INSTALL_GITHUB_ACTIONS": lambda c: c["cicd"]["github_actions"],
-    "INSTALL_K9S": lambda c: c["kubernetes"]["k9s"],
-    "INSTALL_KUSTOMIZE": lambda c: c["kubernetes"]["kustomize"],
-    "INSTALL_ARGOCD_CLI": lambda c: c["kubernetes"]["argocd_cli"],
-    "INSTALL_LENS": lambda c: c["kubernetes"]["lens"],
-    "INSTALL_KUBESEAL": lambda c: c["kubernetes"]["kubeseal"],
-    "INSTALL_FLUX": lambda c: c["kubernetes"]["flux"],
-    "INSTALL_KIND": lambda c: c["kubernetes"]["kind"],
-    "INSTALL_MINIKUBE": lambda c: c["kubernetes"]["minikube"],
-    "INSTALL_OPENSHIFT_CLI": lambda c: c["kubernetes"]["openshift_cli"],
-    "INSTALL_MAKE": lambda c: c["build_tools"]["make"],
-    "INSTALL_CMAKE": lambda c: c["build_tools"]["cmake"],
-    "INSTALL_SONARQUBE": lambda c: c["code_analysis"]["sonarqube"],
-    "INSTALL_CHECKSTYLE": lambda c: c["code_analysis"]["checkstyle"],
-    "INSTALL_PMD": lambda c: c["code_analysis"]["pmd"],
-    "INSTALL_NEXUS": lambda c: c["devops_tools"]["nexus"],
-    "INSTALL_PROMETHEUS": lambda c: c["devops_tools"]["prometheus"],
-    "INSTALL_GRAFANA": lambda c: c["devops_tools"]["grafana"],
-    "INSTALL_ELK": lambda c: c["devops_tools"]["elk"],
-    "INSTALL_JENKINS": lambda c: c["devops_tools"]["jenkins"],
-}
-
-
-VERSION_ARG_FACTORIES = {
-    "JAVA_VERSION": lambda c: c["versions"].get("java", "21") if c["devops_tools"]["nexus"] else None,
-    "TERRAFORM_VERSION": lambda c: "1.14.7" if c["cicd"]["terraform"] else None,
-    "HELM_VERSION": lambda c: "4.0.1" if c["cicd"]["helm"] else None,
-    "ACTIONS_RUNNER_VERSION": lambda c: "2.330.0" if c["cicd"]["github_actions"] else None,
-    "K9S_VERSION": lambda c: c["versions"].get("k9s", "0.50.16") if c["kubernetes"]["k9s"] else None,
-    "KUSTOMIZE_VERSION": lambda c: c["versions"].get("kustomize", "5.8.0") if c["kubernetes"]["kustomize"] else None,
-    "ARGOCD_VERSION": lambda c: c["versions"].get("argocd", "3.3.6") if c["kubernetes"]["argocd_cli"] else None,
-    "FLUX_VERSION": lambda c: c["versions"].get("flux", "2.8.5") if c["kubernetes"]["flux"] else None,
-    "KUBESEAL_VERSION": lambda c: "0.33.1" if c["kubernetes"]["kubeseal"] else None,
-    "KIND_VERSION": lambda c: "0.31.0" if c["kubernetes"]["kind"] else None,
-    "MINIKUBE_VERSION": lambda c: "1.37.0" if c["kubernetes"]["minikube"] else None,
-    "SONAR_SCANNER_VERSION": lambda c: "8.0.1.6346" if c["code_analysis"]["sonarqube"] else None,
-    "CHECKSTYLE_VERSION": lambda c: "12.1.2" if c["code_analysis"]["checkstyle"] else None,
-    "PMD_VERSION": lambda c: "7.18.0" if c["code_analysis"]["pmd"] else None,
-    "NEXUS_VERSION": lambda c: c["versions"].get("nexus", "3.91.0") if c["devops_tools"]["nexus"] else None,
-    "PROMETHEUS_VERSION": lambda c: c["versions"].get("prometheus", "3.5.1") if c["devops_tools"]["prometheus"] else None,
-    "GRAFANA_VERSION": lambda c: c["versions"].get("grafana", "12.4.2") if c["devops_tools"]["grafana"] else None,
-}
+# Read-only view so the defaults cannot be mutated by accident; use thaw() for a working copy.
+DEFAULT_CONFIG = MappingProxyType({
+    section: MappingProxyType(values) for section, values in _DEFAULT_CONFIG.items()
+})
+
+
+# (build arg, config section, config key)
+BUILD_ARG_SPEC = (
+    ("INSTALL_CSHARP", "languages", "csharp"),
+    ("INSTALL_KOTLIN", "languages", "kotlin"),
+    ("INSTALL_C", "languages", "c"),
+    ("INSTALL_CPP", "languages", "cpp"),
+    ("INSTALL_DOCKER", "cicd", "docker"),
+    ("INSTALL_PODMAN", "cicd", "podman"),
+    ("INSTALL_TERRAFORM", "cicd", "terraform"),
+    ("INSTALL_KUBECTL", "cicd", "kubectl"),
+    ("INSTALL_HELM", "cicd", "helm"),
+    ("INSTALL_GITHUB_ACTIONS", "cicd", "github_actions"),
+    ("INSTALL_K9S", "kubernetes", "k9s"),
+    ("INSTALL_KUSTOMIZE", "kubernetes", "kustomize"),
+    ("INSTALL_ARGOCD_CLI", "kubernetes", "argocd_cli"),
+    ("INSTALL_LENS", "kubernetes", "lens"),
+    ("INSTALL_KUBESEAL", "kubernetes", "kubeseal"),
+    ("INSTALL_FLUX", "kubernetes", "flux"),
+    ("INSTALL_KIND", "kubernetes", "kind"),
+    ("INSTALL_MINIKUBE", "kubernetes", "minikube"),
+    ("INSTALL_OPENSHIFT_CLI", "kubernetes", "openshift_cli"),
+    ("INSTALL_MAKE", "build_tools", "make"),
+    ("INSTALL_CMAKE", "build_tools", "cmake"),
+    ("INSTALL_SONARQUBE", "code_analysis", "sonarqube"),
+    ("INSTALL_CHECKSTYLE", "code_analysis", "checkstyle"),
+    ("INSTALL_PMD", "code_analysis", "pmd"),
+    ("INSTALL_NEXUS", "devops_tools", "nexus"),
+    ("INSTALL_PROMETHEUS", "devops_tools", "prometheus"),
+    ("INSTALL_GRAFANA", "devops_tools", "grafana"),
+    ("INSTALL_ELK", "devops_tools", "elk"),
+    ("INSTALL_JENKINS", "devops_tools", "jenkins"),
+)
+
+
+# (build arg, gating section, gating key, versions key or None, default version)
+VERSION_ARG_SPEC = (
+    ("JAVA_VERSION", "devops_tools", "nexus", "java", "21"),
+    ("TERRAFORM_VERSION", "cicd", "terraform", None, "1.14.7"),
+    ("HELM_VERSION", "cicd", "helm", None, "4.0.1"),
+    ("ACTIONS_RUNNER_VERSION", "cicd", "github_actions", None, "2.330.0"),
+    ("K9S_VERSION", "kubernetes", "k9s", "k9s", "0.50.16"),
+    ("KUSTOMIZE_VERSION", "kubernetes", "kustomize", "kustomize", "5.8.0"),
+    ("ARGOCD_VERSION", "kubernetes", "argocd_cli", "argocd", "3.3.6"),
+    ("FLUX_VERSION", "kubernetes", "flux", "flux", "2.8.5"),
+    ("KUBESEAL_VERSION", "kubernetes", "kubeseal", None, "0.33.1"),
+    ("KIND_VERSION", "kubernetes", "kind", None, "0.31.0"),
+    ("MINIKUBE_VERSION", "kubernetes", "minikube", None, "1.37.0"),
+    ("SONAR_SCANNER_VERSION", "code_analysis", "sonarqube", None, "8.0.1.6346"),
+    ("CHECKSTYLE_VERSION", "code_analysis", "checkstyle", None, "12.1.2"),
+    ("PMD_VERSION", "code_analysis", "pmd", None, "7.18.0"),
+    ("NEXUS_VERSION", "devops_tools", "nexus", "nexus", "3.91.0"),
+    ("PROMETHEUS_VERSION", "devops_tools", "prometheus", "prometheus", "3.5.1"),
+    ("GRAFANA_VERSION", "devops_tools", "grafana", "grafana", "12.4.2"),
+)
+
+
+# (section, keys, extensions): the extensions are added when any of the keys
+# is enabled in the section. The "derived" section holds the compound flags
+# that build_extensions computes once per config.
+EXTENSION_RULES = (
+    ("languages", ("python",), (
+        "ms-python.python",
+        "ms-python.vscode-pylance",
+        "ms-python.black-formatter",
+    )),
+    ("derived", ("java",), (
+        "vscjava.vscode-java-pack",
+        "redhat.java",
+        "vscjava.vscode-maven",
+        "vscjava.vscode-gradle",
+    )),
+    ("derived", ("node",), (
+        "dbaeumer.vscode-eslint",
+        "esbenp.prettier-vscode",
+        "ms-vscode.vscode-typescript-next",
+    )),
+    ("languages", ("go",), ("golang.go",)),
+    ("languages", ("ruby",), ("Shopify.ruby-lsp",)),
+    ("languages", ("php",), (
+        "bmewburn.vscode-intelephense-client",
+        "xdebug.php-debug",
+    )),
+    ("languages", ("rust",), (
+        "rust-lang.rust-analyzer",
+        "tamasfe.even-better-toml",
+    )),
+    ("languages", ("csharp",), (
+        "ms-dotnettools.csharp",
+        "ms-dotnettools.csdevkit",
+    )),
+    ("languages", ("c", "cpp"), ("ms-vscode.cpptools",)),
+    ("languages", ("kotlin",), ("fwcd.kotlin",)),
+    ("cicd", ("docker", "podman"), ("ms-azuretools.vscode-docker",)),
+    ("cicd", ("terraform",), ("hashicorp.terraform",)),
+    ("cicd", ("kubectl", "helm"), ("ms-kubernetes-tools.vscode-kubernetes-tools",)),
+    ("derived", ("kubernetes",), (
+        "ms-kubernetes-tools.vscode-kubernetes-tools",
+        "mindaro.mindaro",
+    )),
+    ("kubernetes", ("argocd_cli",), ("argoproj.argocd-vscode-extension",)),
+    ("kubernetes", ("flux",), ("weaveworks.vscode-gitops-tools",)),
+    ("cicd", ("github_actions",), ("github.vscode-github-actions",)),
+    ("code_analysis", ("sonarqube",), ("SonarSource.sonarlint-vscode",)),
+    ("derived", ("java_checkstyle",), ("shengchen.vscode-checkstyle",)),
+    ("derived", ("java_pmd",), ("vscjava.vscode-java-dependency",)),
+    ("devops_tools", ("jenkins",), ("secanis.jenkinsfile-support",)),
+)
+
+
+GENERAL_EXTENSIONS = (
+    "github.copilot",
+    "github.copilot-chat",
+    "ms-vsliveshare.vsliveshare",
+    "streetsidesoftware.code-spell-checker",
+    "eamodio.gitlens",
+)
+
+
+PORT_RULES = (
+    ("nexus", (8081,)),
+    ("prometheus", (9090,)),
+    ("grafana", (3000,)),
+    ("elk", (9200, 9300, 5601)),
+    ("jenkins", (8080,)),
+)
 
 
 FEATURE_REFS = {
@@ -146,8 +244,34 @@ FEATURE_REFS = {
 }
 
 
+def dumps_json(data):
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n"
+    return (json.dumps(data, indent=2) + "\n").encode("utf-8")
+
+
+def loads_json(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_atomic(path, data):
+    # Write next to the target and rename so readers never see a partial file.
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb", buffering=1 << 16) as handle:
+        handle.write(data)
+    os.replace(tmp_path, path)
+
+
+def thaw(value):
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: thaw(item) for key, item in value.items()}
+    return value
+
+
 def deep_merge(defaults, data):
-    merged = deepcopy(defaults)
+    merged = thaw(defaults)
     for key, value in data.items():
         if isinstance(value, dict) and isinstance(merged.get(key), dict):
             merged[key] = deep_merge(merged[key], value)
@@ -156,28 +280,24 @@ def deep_merge(defaults, data):
     return merged
 
 
-if os.path.exists(CONFIG_FILE):
-    with open(CONFIG_FILE, "r", encoding="utf-8") as handle:
-        config = deep_merge(DEFAULT_CONFIG, json.load(handle))
+if CONFIG_FILE.exists():
+    config = deep_merge(DEFAULT_CONFIG, loads_json(CONFIG_FILE.read_bytes()))
 else:
-    config = deepcopy(DEFAULT_CONFIG)
-    with open(CONFIG_FILE, "w", encoding="utf-8") as handle:
-        json.dump(config, handle, indent=2)
-        handle.write("\n")
+    config = thaw(DEFAULT_CONFIG)
+    if os.environ.get("DEVCONTAINER_PERSIST_DEFAULTS") == "1":
+        write_atomic(CONFIG_FILE, dumps_json(config))
 
 
 def unique(values):
-    seen = set()
-    ordered = []
-    for value in values:
-        if value not in seen:
-            seen.add(value)
-            ordered.append(value)
-    return ordered
+    return list(dict.fromkeys(values))
 
 
 def bool_string(value):
-    return str(bool(value)).lower()
+    return BOOL_STRINGS[bool(value)]
+
+
+def status_line(name, enabled):
+    return f"- {name}: {'Enabled' if enabled else 'Disabled'}"
 
 
 def normalize_go_version(version):
@@ -188,21 +308,24 @@ def normalize_go_version(version):
 
 
 def java_feature_enabled(cfg):
+    build_tools = cfg["build_tools"]
+    analysis = cfg["code_analysis"]
     return (
         cfg["languages"]["java"]
-        or cfg["build_tools"]["gradle"]
-        or cfg["build_tools"]["maven"]
-        or cfg["build_tools"]["ant"]
-        or cfg["code_analysis"]["checkstyle"]
-        or cfg["code_analysis"]["pmd"]
+        or build_tools["gradle"]
+        or build_tools["maven"]
+        or build_tools["ant"]
+        or analysis["checkstyle"]
+        or analysis["pmd"]
     )
 
 
 def node_feature_enabled(cfg):
+    langs = cfg["languages"]
     return (
-        cfg["languages"]["node"]
-        or cfg["languages"]["javascript"]
-        or cfg["languages"]["typescript"]
+        langs["node"]
+        or langs["javascript"]
+        or langs["typescript"]
         or cfg["code_analysis"]["eslint"]
     )
 
@@ -210,8 +333,10 @@ def node_feature_enabled(cfg):
 def build_features(cfg):
     features = {}
     versions = cfg["versions"]
+    langs = cfg["languages"]
+    build_tools = cfg["build_tools"]
 
-    if cfg["languages"]["python"]:
+    if langs["python"]:
         features[FEATURE_REFS["python"]] = {
             "version": versions.get("python", "3.12"),
             "installTools": False,
@@ -221,9 +346,9 @@ def build_features(cfg):
         features[FEATURE_REFS["java"]] = {
             "version": versions.get("java", "21"),
             "jdkDistro": "ms",
-            "installGradle": cfg["build_tools"]["gradle"],
-            "installMaven": cfg["build_tools"]["maven"],
-            "installAnt": cfg["build_tools"]["ant"],
+            "installGradle": build_tools["gradle"],
+            "installMaven": build_tools["maven"],
+            "installAnt": build_tools["ant"],
         }
 
     if node_feature_enabled(cfg):
@@ -232,18 +357,18 @@ def build_features(cfg):
             "nodeGypDependencies": True,
         }
 
-    if cfg["languages"]["go"]:
+    if langs["go"]:
         features[FEATURE_REFS["go"]] = {
             "version": normalize_go_version(versions.get("go", "1.25.0")),
         }
 
-    if cfg["languages"]["ruby"]:
+    if langs["ruby"]:
         features[FEATURE_REFS["ruby"]] = {}
 
-    if cfg["languages"]["php"]:
+    if langs["php"]:
         features[FEATURE_REFS["php"]] = {"installComposer": True}
 
-    if cfg["languages"]["rust"]:
+    if langs["rust"]:
         features[FEATURE_REFS["rust"]] = {
             "profile": "minimal",
             "components": "rust-analyzer,rust-src,rustfmt,clippy",
@@ -253,124 +378,65 @@ def build_features(cfg):
 
 
 def build_args(cfg):
-    args = {}
-    for name, factory in BUILD_ARG_FACTORIES.items():
-        args[name] = bool_string(factory(cfg))
-
-    for name, factory in VERSION_ARG_FACTORIES.items():
-        value = factory(cfg)
-        if value is not None:
-            args[name] = str(value)
-
+    args = {
+        name: bool_string(cfg[section].get(key, False))
+        for name, section, key in BUILD_ARG_SPEC
+    }
+    versions = cfg["versions"]
+    for name, section, key, version_key, default in VERSION_ARG_SPEC:
+        if cfg[section][key]:
+            args[name] = str(versions.get(version_key, default) if version_key else default)
     return args
 
 
 def build_extensions(cfg):
-    extensions = []
-    langs = cfg["languages"]
-    cicd = cfg["cicd"]
-    k8s = cfg["kubernetes"]
-    build_tools = cfg["build_tools"]
+    java_enabled = java_feature_enabled(cfg)
     analysis = cfg["code_analysis"]
-    devops = cfg["devops_tools"]
+    sections = {
+        "languages": cfg["languages"],
+        "cicd": cfg["cicd"],
+        "kubernetes": cfg["kubernetes"],
+        "code_analysis": analysis,
+        "devops_tools": cfg["devops_tools"],
+        "derived": {
+            "java": java_enabled,
+            "node": node_feature_enabled(cfg),
+            "kubernetes": any(cfg["kubernetes"].values()),
+            "java_checkstyle": analysis["checkstyle"] and java_enabled,
+            "java_pmd": analysis["pmd"] and java_enabled,
+        },
+    }
+    extensions = []
+    for section, keys, rule_extensions in EXTENSION_RULES:
+        values = sections[section]
+        if any(values.get(key, False) for key in keys):
+            extensions.extend(rule_extensions)
+    extensions.extend(GENERAL_EXTENSIONS)
+    return unique(extensions)
 
-    if langs["python"]:
-        extensions.extend([
-            "ms-python.python",
-            "ms-python.vscode-pylance",
-            "ms-python.black-formatter",
-        ])
 
-    if java_feature_enabled(cfg):
-        extensions.extend([
-            "vscjava.vscode-java-pack",
-            "redhat.java",
-            "vscjava.vscode-maven",
-            "vscjava.vscode-gradle",
-        ])
+def build_forward_ports(cfg):
+    devops = cfg["devops_tools"]
+    return unique(port for tool, tool_ports in PORT_RULES if devops[tool] for port in tool_ports)
 
-    if node_feature_enabled(cfg):
-        extensions.extend([
-            "dbaeumer.vscode-eslint",
-            "esbenp.prettier-vscode",
-            "ms-vscode.vscode-typescript-next",
-        ])
 
-    if langs["go"]:
-        extensions.append("golang.go")
-    if langs["ruby"]:
-        extensions.append("Shopify.ruby-lsp")
-    if langs["php"]:
-        extensions.extend([
-            "bmewburn.vscode-intelephense-client",
-            "xdebug.php-debug",
-        ])
-    if langs["rust"]:
-        extensions.extend([
-            "rust-lang.rust-analyzer",
-            "tamasfe.even-better-toml",
-        ])
-    if langs["csharp"]:
-        extensions.extend([
-            "ms-dotnettools.csharp",
-            "ms-dotnettools.csdevkit",
-        ])
-    if langs["c"] or langs["cpp"]:
-        extensions.append("ms-vscode.cpptools")
-    if langs["kotlin"]:
-        extensions.append("fwcd.kotlin")
-
-    if cicd["docker"] or cicd.get("podman", False):
-        extensions.append("ms-azuretools.vscode-docker")
-    if cicd["terraform"]:
-        extensions.append("hashicorp.terraform")
-    if cicd["kubectl"] or cicd["helm"]:
-        extensions.append("ms-kubernetes-tools.vscode-kubernetes-tools")
-    if any(k8s.values()):
-        extensions.extend([
-            "ms-kubernetes-tools.vscode-kubernetes-tools",
-            "mindaro.mindaro",
-        ])
-    if k8s["argocd_cli"]:
-        extensions.append("argoproj.argocd-vscode-extension")
-    if k8s["flux"]:
-        extensions.append("weaveworks.vscode-gitops-tools")
-    if cicd["github_actions"]:
-        extensions.append("github.vscode-github-actions")
-    if analysis["sonarqube"]:
-        extensions.append("SonarSource.sonarlint-vscode")
-    if analysis["checkstyle"] and java_feature_enabled(cfg):
-        extensions.append("shengchen.vscode-checkstyle")
-    if analysis["pmd"] and java_feature_enabled(cfg):
-        extensions.append("vscjava.vscode-java-dependency")
-    if devops["jenkins"]:
-        extensions.append("secanis.jenkinsfile-support")
-
-    extensions.extend([
-        "github.copilot",
-        "github.copilot-chat",
-        "ms-vsliveshare.vsliveshare",
-        "streetsidesoftware.code-spell-checker",
-        "eamodio.gitlens",
-    ])
+def config_cache_key(cfg):
+    # The script's mtime is part of the key so edits to this file invalidate the cache.
+    digest = hashlib.blake2b(json.dumps(cfg, sort_keys=True).encode("utf-8"))
+    digest.update(str(Path(__file__).stat().st_mtime_ns).encode("ascii"))
+    return digest.hexdigest()
 
-    return unique(extensions)
 
+def cache_is_fresh(key):
+    if not DEVCONTAINER_FILE.exists() or not CACHE_FILE.exists():
+        return False
+    return CACHE_FILE.read_text(encoding="utf-8").strip() == key
 
-def build_forward_ports(cfg):
-    ports = []
-    if cfg["devops_tools"]["nexus"]:
-        ports.append(8081)
-    if cfg["devops_tools"]["prometheus"]:
-        ports.append(9090)
-    if cfg["devops_tools"]["grafana"]:
-        ports.append(3000)
-    if cfg["devops_tools"]["elk"]:
-        ports.extend([9200, 9300, 5601])
-    if cfg["devops_tools"]["jenkins"]:
-        ports.append(8080)
-    return ports
 
+cache_key = config_cache_key(config)
+if cache_is_fresh(cache_key):
+    print("devcontainer.json is up to date; nothing to regenerate.")
+    sys.exit(0)
 
 features = build_features(config)
 devcontainer = {
@@ -395,48 +461,26 @@ forward_ports = build_forward_ports(config)
 if forward_ports:
     devcontainer["forwardPorts"] = forward_ports
 
-with open(DEVCONTAINER_FILE, "w", encoding="utf-8") as handle:
-    json.dump(devcontainer, handle, indent=2)
-    handle.write("\n")
-
-print("Created devcontainer.json with configuration for:")
-print("\nProgramming Languages:")
-for lang, enabled in config["languages"].items():
-    print(f"- {lang.capitalize()}: {'Enabled' if enabled else 'Disabled'}")
-
-print("\nFeature-installed Languages:")
-for lang in FEATURE_LANGUAGE_KEYS:
-    print(f"- {lang}: {'Enabled' if config['languages'][lang] else 'Disabled'}")
-
-print("\nFallback-installed Languages:")
-for lang in FALLBACK_LANGUAGE_KEYS:
-    print(f"- {lang}: {'Enabled' if config['languages'][lang] else 'Disabled'}")
-
-print("\nCI/CD Tools:")
-for tool, enabled in config["cicd"].items():
-    print(f"- {tool.capitalize()}: {'Enabled' if enabled else 'Disabled'}")
-
-print("\nKubernetes Tools:")
-for tool, enabled in config["kubernetes"].items():
-    print(f"- {tool.capitalize()}: {'Enabled' if enabled else 'Disabled'}")
-
-print("\nBuild Tools:")
-for tool, enabled in config["build_tools"].items():
-    print(f"- {tool.capitalize()}: {'Enabled' if enabled else 'Disabled'}")
+write_atomic(DEVCONTAINER_FILE, dumps_json(devcontainer))
+write_atomic(CACHE_FILE, (cache_key + "\n").encode("ascii"))
 
-print("\nCode Analysis Tools:")
-for tool, enabled in config["code_analysis"].items():
-    print(f"- {tool.capitalize()}: {'Enabled' if enabled else 'Disabled'}")
+languages = config["languages"]
+lines = ["Created devcontainer.json with configuration for:", "", "Programming Languages:"]
+lines.extend(status_line(lang.capitalize(), enabled) for lang, enabled in languages.items())
+lines.extend(["", "Feature-installed Languages:"])
+lines.extend(status_line(lang, languages[lang]) for lang in FEATURE_LANGUAGE_KEYS)
+lines.extend(["", "Fallback-installed Languages:"])
+lines.extend(status_line(lang, languages[lang]) for lang in FALLBACK_LANGUAGE_KEYS)
 
-print("\nDevOps Tools:")
-for tool, enabled in config["devops_tools"].items():
-    print(f"- {tool.capitalize()}: {'Enabled' if enabled else 'Disabled'}")
+for title, section in SUMMARY_SECTIONS:
+    lines.extend(["", f"{title}:"])
+    lines.extend(status_line(tool.capitalize(), enabled) for tool, enabled in config[section].items())
 
-print("\nForwarded Ports:")
+lines.extend(["", "Forwarded Ports:"])
 if forward_ports:
-    for port in forward_ports:
-        print(f"- Port {port}")
+    lines.extend(f"- Port {port}" for port in forward_ports)
 else:
-    print("- No ports forwarded")
+    lines.append("- No ports forwarded")
 
-print("\nYour DevOps OS dev container is ready to use!")
+lines.extend(["", "Your DevOps OS dev container is ready to use!"])
+sys.stdout.write("\n".join(lines) + "\n")
@@ -8,10 +8,16 @@ legacy generator path for backward compatibility.
 
 from __future__ import annotations
 
+import functools
 import json
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 TEMPLATE_DIR = Path(__file__).resolve().parent / "templates" / "devcontainer"
 
 ALL_LANGUAGES = [
@@ -112,7 +118,7 @@ def split_csv(csv_string: str) -> list[str]:
 
 
 def bool_string(value: Any) -> str:
-    return str(bool(value)).lower()
+    return "true" if value else "false"
 
 
 def normalize_go_version(version: str) -> str:
@@ -123,13 +129,7 @@ def normalize_go_version(version: str) -> str:
 
 
 def unique(values: list[str]) -> list[str]:
-    seen = set()
-    ordered = []
-    for value in values:
-        if value not in seen:
-            seen.add(value)
-            ordered.append(value)
-    return ordered
+    return list(dict.fromkeys(values))
 
 
 def java_feature_enabled(cfg: dict[str, Any]) -> bool:
@@ -201,6 +201,28 @@ def build_env_config(
     }
 
 
+def normalize_env_config(raw: dict[str, Any]) -> dict[str, Any]:
+    """Fill a saved env config out to the full set of tool flags ``init`` renders.
+
+    Unknown keys are dropped and missing tools default to ``False`` so a
+    hand-trimmed devcontainer.env.json can be fed back to ``init --config``.
+    """
+    sections = {
+        "languages": ALL_LANGUAGES,
+        "cicd": ALL_CICD,
+        "kubernetes": ALL_KUBERNETES,
+        "build_tools": ALL_BUILD_TOOLS,
+        "code_analysis": ALL_CODE_ANALYSIS,
+        "devops_tools": ALL_DEVOPS_TOOLS,
+    }
+    cfg: dict[str, Any] = {}
+    for section, names in sections.items():
+        selected = raw.get(section) or {}
+        cfg[section] = {name: bool(selected.get(name, False)) for name in names}
+    cfg["versions"] = {key: str(value) for key, value in (raw.get("versions") or {}).items()}
+    return cfg
+
+
 def build_features(cfg: dict[str, Any]) -> dict[str, Any]:
     versions = cfg["versions"]
     features: dict[str, Any] = {}
@@ -318,9 +340,10 @@ def build_extensions(cfg: dict[str, Any]) -> list[str]:
         extensions.append("ms-azuretools.vscode-docker")
     if cicd["terraform"]:
         extensions.append("hashicorp.terraform")
-    if cicd["kubectl"] or cicd["helm"] or any(k8s.values()):
+    has_any_k8s = any(k8s.values())
+    if cicd["kubectl"] or cicd["helm"] or has_any_k8s:
         extensions.append("ms-kubernetes-tools.vscode-kubernetes-tools")
-    if any(k8s.values()):
+    if has_any_k8s:
         extensions.append("mindaro.mindaro")
     if k8s["argocd_cli"]:
         extensions.append("argoproj.argocd-vscode-extension")
@@ -422,12 +445,21 @@ def build_devcontainer_json(cfg: dict[str, Any]) -> dict[str, Any]:
     return devcontainer
 
 
+@functools.lru_cache(maxsize=None)
 def _load_template(name: str) -> str:
+    # Templates ship with the package, so each one is read from disk once per process.
     return (TEMPLATE_DIR / name).read_text(encoding="utf-8")
 
 
+def dumps_indented(value: Any) -> str:
+    """Serialize *value* as two-space indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(value, indent=2)
+
+
 def _json_fragment(value: Any, indent_prefix: int) -> str:
-    text = json.dumps(value, indent=2)
+    text = dumps_indented(value)
     if "\n" not in text:
         return text
     lines = text.splitlines()
@@ -473,7 +505,6 @@ def render_dockerfile() -> str:
 
 
 def write_generated_devcontainer(output_root: Path, cfg: dict[str, Any]) -> dict[str, Path]:
-    output_root.mkdir(parents=True, exist_ok=True)
     files = {
         "env": output_root / "devcontainer.env.json",
         "json": output_root / "devcontainer.json",
@@ -1,22 +1,14 @@
 import enum
+import importlib
 import sys
 import typer
-from InquirerPy import inquirer
 import json
 import os
+import shutil
 from pathlib import Path
 from typing import Optional
 
 # Import scaffold modules — used as libraries by the unified scaffold sub-commands
-import cli.scaffold_cicd as scaffold_cicd
-import cli.scaffold_gha as scaffold_gha
-import cli.scaffold_jenkins as scaffold_jenkins
-import cli.scaffold_gitlab as scaffold_gitlab
-import cli.scaffold_argocd as scaffold_argocd
-import cli.scaffold_sre as scaffold_sre
-import cli.scaffold_devcontainer as scaffold_devcontainer
-import cli.scaffold_unittest as scaffold_unittest
-import cli.scaffold_hardening as scaffold_hardening
 import cli.process_first as process_first
 from cli import __version__
 from cli.devcontainer_templates import (
@@ -27,9 +19,20 @@ from cli.devcontainer_templates import (
     ALL_KUBERNETES,
     ALL_LANGUAGES,
     DEFAULT_VERSIONS,
+    dumps_indented,
+    normalize_env_config,
     write_generated_devcontainer,
 )
 
+
+def __getattr__(name):
+    """Resolve ``cli.devopsos.inquirer`` on demand now that it is imported lazily."""
+    if name == "inquirer":
+        from InquirerPy import inquirer
+        return inquirer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class ProcessFirstSection(str, enum.Enum):
     """Valid sections for the process-first command."""
     what = "what"
@@ -90,13 +93,30 @@ scaffold_app = typer.Typer(
 app.add_typer(scaffold_app, name="scaffold")
 
 
-def _run_scaffold(module_main, flags: list):
-    """Call *module_main()* with the given CLI flag list via sys.argv.
+# Scaffold target -> module providing its argparse ``main()``.  Modules are
+# imported on first use so a single ``scaffold`` call only loads its own
+# generator instead of all of them.
+_SCAFFOLDERS = {
+    "gha": "cli.scaffold_gha",
+    "jenkins": "cli.scaffold_jenkins",
+    "gitlab": "cli.scaffold_gitlab",
+    "argocd": "cli.scaffold_argocd",
+    "sre": "cli.scaffold_sre",
+    "devcontainer": "cli.scaffold_devcontainer",
+    "cicd": "cli.scaffold_cicd",
+    "unittest": "cli.scaffold_unittest",
+    "hardening": "cli.scaffold_hardening",
+}
+
+
+def _run_scaffold(target: str, flags: list):
+    """Call the *target* scaffold module's ``main()`` with the given CLI flags.
 
     Each scaffold module uses argparse internally.  We temporarily replace
     sys.argv so argparse sees only the program name and the explicit flags
     we build from the Typer-parsed options, then restore sys.argv afterwards.
     """
+    module_main = importlib.import_module(_SCAFFOLDERS[target]).main
     _saved = sys.argv[:]
     sys.argv = sys.argv[:1] + flags
     try:
@@ -181,7 +201,7 @@ def scaffold_gha_cmd(
         flags += ["--custom-values", custom_values]
     if env_file:
         flags += ["--env-file", env_file]
-    _run_scaffold(scaffold_gha.main, flags)
+    _run_scaffold("gha", flags)
 
 
 # ── scaffold jenkins ────────────────────────────────────────────────────────
@@ -242,7 +262,7 @@ def scaffold_jenkins_cmd(
         flags += ["--custom-values", custom_values]
     if env_file:
         flags += ["--env-file", env_file]
-    _run_scaffold(scaffold_jenkins.main, flags)
+    _run_scaffold("jenkins", flags)
 
 
 # ── scaffold gitlab ─────────────────────────────────────────────────────────
@@ -295,7 +315,7 @@ def scaffold_gitlab_cmd(
         flags += ["--kube-namespace", kube_namespace]
     if custom_values:
         flags += ["--custom-values", custom_values]
-    _run_scaffold(scaffold_gitlab.main, flags)
+    _run_scaffold("gitlab", flags)
 
 
 # ── scaffold argocd ─────────────────────────────────────────────────────────
@@ -358,7 +378,7 @@ def scaffold_argocd_cmd(
         flags.append("--rollouts")
     if allow_any_source_repo:
         flags.append("--allow-any-source-repo")
-    _run_scaffold(scaffold_argocd.main, flags)
+    _run_scaffold("argocd", flags)
 
 
 # ── scaffold sre ────────────────────────────────────────────────────────────
@@ -414,7 +434,7 @@ def scaffold_sre_cmd(
     ]
     if pagerduty_key:
         flags += ["--pagerduty-key", pagerduty_key]
-    _run_scaffold(scaffold_sre.main, flags)
+    _run_scaffold("sre", flags)
 
 
 # ── scaffold devcontainer ───────────────────────────────────────────────────
@@ -506,7 +526,7 @@ def scaffold_devcontainer_cmd(
         "--grafana-version", grafana_version,
         "--output-dir", output_dir,
     ]
-    _run_scaffold(scaffold_devcontainer.main, flags)
+    _run_scaffold("devcontainer", flags)
 
 
 # ── scaffold cicd ───────────────────────────────────────────────────────────
@@ -569,7 +589,7 @@ def scaffold_cicd_cmd(
         flags.append("--all")
     if custom_values:
         flags += ["--custom-values", custom_values]
-    _run_scaffold(scaffold_cicd.main, flags)
+    _run_scaffold("cicd", flags)
 
 
 # ── scaffold unittest ────────────────────────────────────────────────────────
@@ -636,7 +656,7 @@ def scaffold_unittest_cmd(
     if not coverage:
         # coverage defaults to True; only pass flag when False
         flags.append("--no-coverage")
-    _run_scaffold(scaffold_unittest.main, flags)
+    _run_scaffold("unittest", flags)
 
 
 # ── scaffold hardening ──────────────────────────────────────────────────────
@@ -689,55 +709,53 @@ def scaffold_hardening_cmd(
     ]
     if compliance_framework:
         flags += ["--compliance-framework", compliance_framework]
-    _run_scaffold(scaffold_hardening.main, flags)
-
-
-@app.command()
-def init(
-    directory: str = typer.Option(".", "--dir", help="Target directory in which the .devcontainer folder will be created (defaults to the current directory)"),
-):
-    """Interactive project initializer."""
+    _run_scaffold("hardening", flags)
+
+
+# ── Wizard groups aligned with Process-First DevOps principles ────────
+# Each group maps to a DevOps stage in the Systems Thinking value stream.
+_WIZARD_GROUPS = {
+    "Languages": {
+        "choices": ALL_LANGUAGES,
+        "description": "Programming languages for your project",
+    },
+    "Containerization  [CONTAINER stage]": {
+        "choices": ["docker", "podman"],
+        "description": "Container runtimes to build, ship, and run application images",
+    },
+    "Build Tools  [BUILD stage]": {
+        "choices": ["gradle", "maven", "ant", "make", "cmake", "nexus"],
+        "description": "Tools to compile, package, and store build artifacts",
+    },
+    "Test & Quality  [TEST stage]": {
+        "choices": ["sonarqube", "checkstyle", "pmd", "eslint", "pylint"],
+        "description": "Static analysis and quality gates to enforce standards early",
+    },
+    "Kubernetes  [KUBERNETES stage]": {
+        "choices": ["kubectl", "helm", "kustomize", "k9s", "argocd_cli",
+                    "flux", "kind", "minikube", "lens", "kubeseal", "openshift_cli"],
+        "description": "Kubernetes CLI tools, GitOps engines, and local cluster runtimes",
+    },
+    "CI/CD & Deploy  [DEPLOY stage]": {
+        "choices": ["github_actions", "jenkins", "terraform"],
+        "description": "CI/CD pipelines, IaC provisioning, and deployment automation",
+    },
+    "SRE & Monitoring  [SRE/MONITORING stage]": {
+        "choices": ["prometheus", "grafana", "elk"],
+        "description": "Observability stack: metrics, dashboards, and centralised logs",
+    },
+}
+
+
+def _wizard_config(inquirer) -> dict:
+    """Prompt for tool selections and versions, returning the init config dict."""
     typer.echo("Welcome to DevOps-OS Init Wizard!")
     typer.echo("Tools are grouped by Process-First DevOps principles (Systems Thinking).\n")
 
-    # ── Wizard groups aligned with Process-First DevOps principles ────────
-    # Each group maps to a DevOps stage in the Systems Thinking value stream.
-    wizard_groups = {
-        "Languages": {
-            "choices": ALL_LANGUAGES,
-            "description": "Programming languages for your project",
-        },
-        "Containerization  [CONTAINER stage]": {
-            "choices": ["docker", "podman"],
-            "description": "Container runtimes to build, ship, and run application images",
-        },
-        "Build Tools  [BUILD stage]": {
-            "choices": ["gradle", "maven", "ant", "make", "cmake", "nexus"],
-            "description": "Tools to compile, package, and store build artifacts",
-        },
-        "Test & Quality  [TEST stage]": {
-            "choices": ["sonarqube", "checkstyle", "pmd", "eslint", "pylint"],
-            "description": "Static analysis and quality gates to enforce standards early",
-        },
-        "Kubernetes  [KUBERNETES stage]": {
-            "choices": ["kubectl", "helm", "kustomize", "k9s", "argocd_cli",
-                        "flux", "kind", "minikube", "lens", "kubeseal", "openshift_cli"],
-            "description": "Kubernetes CLI tools, GitOps engines, and local cluster runtimes",
-        },
-        "CI/CD & Deploy  [DEPLOY stage]": {
-            "choices": ["github_actions", "jenkins", "terraform"],
-            "description": "CI/CD pipelines, IaC provisioning, and deployment automation",
-        },
-        "SRE & Monitoring  [SRE/MONITORING stage]": {
-            "choices": ["prometheus", "grafana", "elk"],
-            "description": "Observability stack: metrics, dashboards, and centralised logs",
-        },
-    }
-
     selected_by_group: dict = {}
     selected_versions: dict = {}
 
-    for group_label, group_info in wizard_groups.items():
+    for group_label, group_info in _WIZARD_GROUPS.items():
         typer.echo(f"\n  📌 {group_info['description']}")
         selected = inquirer.checkbox(
             message=f"Select {group_label}:",
@@ -759,7 +777,7 @@ def init(
     # ── Map wizard selections back to legacy JSON structure ───────────────
     # Keep the devcontainer.env.json keys identical to scaffold_devcontainer
     # output for backward compatibility.
-    def _sel(group): return selected_by_group.get(group, [])
+    def _sel(group): return frozenset(selected_by_group.get(group, ()))
 
     container_sel = _sel("Containerization  [CONTAINER stage]")
     build_sel     = _sel("Build Tools  [BUILD stage]")
@@ -802,24 +820,66 @@ def init(
         },
         "versions": selected_versions,
     }
+    return config
+
+
+def _load_init_config(config_file: str) -> dict:
+    """Read a saved devcontainer.env.json for a non-interactive ``init`` run."""
+    try:
+        raw = json.loads(Path(config_file).read_bytes())
+    except (OSError, ValueError) as exc:
+        typer.echo(f"Error: cannot read config file {config_file}: {exc}", err=True)
+        raise typer.Exit(1)
+    if not isinstance(raw, dict):
+        typer.echo(f"Error: config file {config_file} must contain a JSON object", err=True)
+        raise typer.Exit(1)
+    return normalize_env_config(raw)
+
+
+@app.command()
+def init(
+    directory: str = typer.Option(".", "--dir", help="Target directory in which the .devcontainer folder will be created (defaults to the current directory)"),
+    config_file: Optional[str] = typer.Option(None, "--config", help="Reuse a saved devcontainer.env.json instead of prompting for tool selections"),
+    assume_yes: bool = typer.Option(False, "--yes", "-y", help="Skip the confirmation prompt"),
+):
+    """Interactive project initializer."""
+    if config_file:
+        config = _load_init_config(config_file)
+    else:
+        # InquirerPy (and prompt_toolkit behind it) is only needed by the wizard,
+        # so scaffold calls in CI never pay for importing it.
+        from InquirerPy import inquirer
+        config = _wizard_config(inquirer)
 
     # Review step: show config and confirm
     typer.echo("\nReview your configuration:")
-    typer.echo(json.dumps(config, indent=2))
-    if not inquirer.confirm(message="Proceed with this configuration?", default=True).execute():
-        typer.echo("Aborted by user.")
-        raise typer.Exit(1)
+    typer.echo(dumps_indented(config))
+    if not assume_yes:
+        from InquirerPy import inquirer
+        if not inquirer.confirm(message="Proceed with this configuration?", default=True).execute():
+            typer.echo("Aborted by user.")
+            raise typer.Exit(1)
 
     target_root = Path(directory)
     devcontainer_dir = target_root / ".devcontainer"
-    if devcontainer_dir.exists():
+    # Creating the directory doubles as the existence check, so an existing
+    # .devcontainer is never overwritten even if it appears mid-run.
+    try:
+        devcontainer_dir.mkdir(parents=True)
+    except FileExistsError:
         typer.echo(
             f"Existing {devcontainer_dir} detected. Preserving it and skipping devcontainer generation."
         )
         typer.echo("Remove or rename the existing .devcontainer/ directory if you want init to generate a new one.")
         raise typer.Exit(0)
 
-    written = write_generated_devcontainer(devcontainer_dir, config)
+    try:
+        written = write_generated_devcontainer(devcontainer_dir, config)
+    except BaseException:
+        # Don't leave a half-populated .devcontainer behind: it would make the
+        # next init skip generation as if the user had their own.
+        shutil.rmtree(devcontainer_dir, ignore_errors=True)
+        raise
     typer.echo(f"Wrote configuration to {written['env']}")
     typer.echo(f"Wrote Dockerfile to {written['dockerfile']}")
     typer.echo(f"Wrote devcontainer.json to {written['json']}")
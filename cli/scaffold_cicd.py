@@ -14,6 +14,7 @@ Usage:
 import os
 import sys
 import argparse
+from pathlib import Path
 
 
 def _run_module_main(module_main, flags: list) -> bool:
@@ -37,8 +38,12 @@ def _run_module_main(module_main, flags: list) -> bool:
         sys.argv = saved
 
 
-def parse_arguments():
-    """Parse command line arguments."""
+def _build_parser():
+    """Build the argument parser.
+
+    ``--output-dir`` defaults to ``None`` and is resolved against the working
+    directory at parse time, since the parser itself is built at import.
+    """
     parser = argparse.ArgumentParser(
         description="Generate CI/CD configurations (GitHub Actions + Jenkins) for DevOps-OS"
     )
@@ -65,7 +70,7 @@ def parse_arguments():
         help="Kubernetes deployment method",
         default="kubectl",
     )
-    parser.add_argument("--output-dir", help="Root output directory", default=os.getcwd())
+    parser.add_argument("--output-dir", help="Root output directory (default: current directory)")
     parser.add_argument("--registry", help="Container registry URL", default="docker.io")
     parser.add_argument(
         "--image",
@@ -99,7 +104,17 @@ def parse_arguments():
         help="Generate both GitHub Actions and Jenkins (default when neither --github nor --jenkins is given)",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def parse_arguments(argv=None):
+    """Parse command line arguments."""
+    args = _PARSER.parse_args(argv)
+    if args.output_dir is None:
+        args.output_dir = os.getcwd()
 
     # Default to --all when neither --github nor --jenkins is specified
     if not (args.github or args.jenkins or args.all):
@@ -118,8 +133,8 @@ def run_github_generator(args) -> bool:
 
     print("Generating GitHub Actions workflow...")
 
+    # scaffold_gha creates the output directory itself
     github_output = os.path.join(args.output_dir, ".github", "workflows")
-    os.makedirs(github_output, exist_ok=True)
 
     flags = [
         "--name", args.name,
@@ -178,47 +193,60 @@ def create_readme(args):
     """Create a README.md file explaining the generated CI/CD files."""
     readme_path = os.path.join(args.output_dir, "CICD-README.md")
     
-    with open(readme_path, "w") as f:
-        f.write(f"# {args.name} CI/CD Configuration\n\n")
-        f.write("This directory contains CI/CD configuration files generated by DevOps-OS.\n\n")
-        
-        if args.github:
-            f.write("## GitHub Actions Workflow\n\n")
-            f.write(f"- Type: {args.type}\n")
-            f.write(f"- Languages: {args.languages}\n")
-            if args.kubernetes:
-                f.write(f"- Kubernetes Deployment Method: {args.k8s_method}\n")
-            if args.matrix:
-                f.write("- Matrix Build: Enabled\n")
-            f.write("\nWorkflow location: `.github/workflows/`\n\n")
-        
-        if args.jenkins:
-            f.write("## Jenkins Pipeline\n\n")
-            f.write(f"- Type: {args.type}\n")
-            f.write(f"- Languages: {args.languages}\n")
-            if args.kubernetes:
-                f.write(f"- Kubernetes Deployment Method: {args.k8s_method}\n")
-            if args.parameters:
-                f.write("- Parameterized: Enabled\n")
-            f.write("\nPipeline location: `Jenkinsfile`\n\n")
-        
-        f.write("## Usage\n\n")
-        
-        if args.github:
-            f.write("### GitHub Actions\n\n")
-            f.write("The GitHub Actions workflow will automatically run when you push to your repository.\n\n")
-        
-        if args.jenkins:
-            f.write("### Jenkins\n\n")
-            f.write("To use the Jenkins pipeline:\n\n")
-            f.write("1. Create a new Jenkins Pipeline job\n")
-            f.write("2. Configure it to use the Jenkinsfile in your repository\n")
-            if args.parameters:
-                f.write("3. The pipeline includes parameters you can configure for each build\n\n")
-        
-        f.write("\n## Generated with DevOps-OS\n\n")
-        f.write("These CI/CD configurations were generated using DevOps-OS CI/CD generators.\n")
-        f.write("For more information, see the DevOps-OS documentation.\n")
+    parts = []
+    parts.append(f"# {args.name} CI/CD Configuration\n\n")
+    parts.append("This directory contains CI/CD configuration files generated by DevOps-OS.\n\n")
+    
+    if args.github:
+        parts.append("## GitHub Actions Workflow\n\n")
+        parts.append(f"- Type: {args.type}\n")
+        parts.append(f"- Languages: {args.languages}\n")
+        if args.kubernetes:
+            parts.append(f"- Kubernetes Deployment Method: {args.k8s_method}\n")
+        if args.matrix:
+            parts.append("- Matrix Build: Enabled\n")
+        parts.append("\nWorkflow location: `.github/workflows/`\n\n")
+    
+    if args.jenkins:
+        parts.append("## Jenkins Pipeline\n\n")
+        parts.append(f"- Type: {args.type}\n")
+        parts.append(f"- Languages: {args.languages}\n")
+        if args.kubernetes:
+            parts.append(f"- Kubernetes Deployment Method: {args.k8s_method}\n")
+        if args.parameters:
+            parts.append("- Parameterized: Enabled\n")
+        parts.append("\nPipeline location: `Jenkinsfile`\n\n")
+    
+    parts.append("## Usage\n\n")
+    
+    if args.github:
+        parts.append("### GitHub Actions\n\n")
+        parts.append("The GitHub Actions workflow will automatically run when you push to your repository.\n\n")
+    
+    if args.jenkins:
+        parts.append("### Jenkins\n\n")
+        parts.append("To use the Jenkins pipeline:\n\n")
+        parts.append("1. Create a new Jenkins Pipeline job\n")
+        parts.append("2. Configure it to use the Jenkinsfile in your repository\n")
+        if args.parameters:
+            parts.append("3. The pipeline includes parameters you can configure for each build\n\n")
+    
+    parts.append("\n## Generated with DevOps-OS\n\n")
+    parts.append("These CI/CD configurations were generated using DevOps-OS CI/CD generators.\n")
+    parts.append("For more information, see the DevOps-OS documentation.\n")
+    
+    content = "".join(parts)
+    
+    # Leave an identical README untouched so its mtime only moves on real changes
+    try:
+        unchanged = Path(readme_path).read_bytes() == content.encode("utf-8")
+    except OSError:
+        unchanged = False
+    if unchanged:
+        print(f"CI/CD README unchanged: {readme_path}")
+        return
+    
+    Path(readme_path).write_text(content, encoding="utf-8", newline="")
     
     print(f"Created CI/CD README: {readme_path}")
 
@@ -18,13 +18,28 @@ Features:
 import os
 import sys
 import argparse
+import functools
 import json
+import re
 import yaml
 from string import Template
 from pathlib import Path
+from stat import S_ISREG
 
+try:
+    # libyaml-backed emitter; fall back to the pure-Python one when PyYAML
+    # was built without the C extension.
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeDumper as _SafeDumper
 
-class _NoAliasDumper(yaml.Dumper):
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+
+class _NoAliasDumper(_SafeDumper):
     """Custom YAML Dumper that never emits anchors or aliases.
 
     When the same Python object (e.g. a ``branches`` list) is referenced in
@@ -45,6 +60,15 @@ class _NoAliasDumper(yaml.Dumper):
         return True
 
 
+def dump_workflow(workflow, stream=None):
+    """Serialise *workflow* to YAML the way the generated files are written.
+
+    Keys keep their insertion order and no anchors or aliases are emitted.
+    Returns the YAML string when *stream* is None, otherwise writes to it.
+    """
+    return yaml.dump(workflow, stream, sort_keys=False, Dumper=_NoAliasDumper)
+
+
 # Default paths
 TEMPLATE_DIR = os.path.dirname(os.path.abspath(__file__))
 OUTPUT_DIR = os.getcwd()
@@ -56,76 +80,129 @@ WORKFLOW_TYPES = ["build", "test", "deploy", "complete", "reusable"]
 # Environment variable prefixes
 ENV_PREFIX = "DEVOPS_OS_GHA_"
 
-def parse_arguments():
-    """Parse command line arguments with environment variable fallbacks."""
+# Whole-line // comments allowed in devcontainer.env.json
+_LINE_COMMENT_RE = re.compile(r"^[ \t]*//.*$", re.MULTILINE)
+
+# Environment-variable fallbacks for each option: dest -> (suffix after ENV_PREFIX, default)
+ENV_DEFAULTS = {
+    "name": ("NAME", "DevOps-OS"),
+    "type": ("TYPE", "complete"),
+    "languages": ("LANGUAGES", "python,javascript"),
+    "kubernetes": ("KUBERNETES", "false"),
+    "registry": ("REGISTRY", "ghcr.io"),
+    "k8s_method": ("K8S_METHOD", "kubectl"),
+    "output": ("OUTPUT", os.path.join(OUTPUT_DIR, ".github/workflows")),
+    "custom_values": ("CUSTOM_VALUES", None),
+    "image": ("IMAGE", "ghcr.io/yourorg/devops-os:latest"),
+    "branches": ("BRANCHES", "main"),
+    "matrix": ("MATRIX", "false"),
+    "env_file": ("ENV_FILE", ENV_CONFIG_PATH),
+    "reusable": ("REUSABLE", "false"),
+}
+
+# Options whose environment value is a "true"/"1"/"yes" switch
+BOOL_OPTIONS = frozenset({"kubernetes", "matrix", "reusable"})
+
+def _build_parser():
+    """Build the argument parser.
+
+    Every option defaults to ``None`` so that ``parse_arguments`` can tell an
+    omitted option apart from one given on the command line and fill it from
+    the environment at parse time.
+    """
     parser = argparse.ArgumentParser(description="Generate GitHub Actions workflow files for DevOps-OS")
     parser.add_argument("--name", 
-                       help="Workflow name",
-                       default=os.environ.get(f"{ENV_PREFIX}NAME", "DevOps-OS"))
+                       help="Workflow name")
     parser.add_argument("--type", choices=WORKFLOW_TYPES, 
-                       help="Type of workflow to generate",
-                       default=os.environ.get(f"{ENV_PREFIX}TYPE", "complete"))
+                       help="Type of workflow to generate")
     parser.add_argument("--languages", 
-                       help="Comma-separated list of languages to enable (python,java,javascript,go)",
-                       default=os.environ.get(f"{ENV_PREFIX}LANGUAGES", "python,javascript"))
-    parser.add_argument("--kubernetes", action="store_true", 
-                       help="Include Kubernetes deployment steps",
-                       default=os.environ.get(f"{ENV_PREFIX}KUBERNETES", "false").lower() in ("true", "1", "yes"))
+                       help="Comma-separated list of languages to enable (python,java,javascript,go)")
+    parser.add_argument("--kubernetes", action="store_true", default=None,
+                       help="Include Kubernetes deployment steps")
     parser.add_argument("--registry", 
-                       help="Container registry URL",
-                       default=os.environ.get(f"{ENV_PREFIX}REGISTRY", "ghcr.io"))
+                       help="Container registry URL")
     parser.add_argument("--k8s-method", choices=["kubectl", "kustomize", "argocd", "flux"],
-                       help="Kubernetes deployment method",
-                       default=os.environ.get(f"{ENV_PREFIX}K8S_METHOD", "kubectl"))
+                       help="Kubernetes deployment method")
     parser.add_argument("--output", 
-                       help="Output directory for generated workflow files",
-                       default=os.environ.get(f"{ENV_PREFIX}OUTPUT", os.path.join(OUTPUT_DIR, ".github/workflows")))
+                       help="Output directory for generated workflow files")
     parser.add_argument("--custom-values", 
-                       help="Path to custom values JSON file",
-                       default=os.environ.get(f"{ENV_PREFIX}CUSTOM_VALUES"))
+                       help="Path to custom values JSON file")
     parser.add_argument("--image", 
-                       help="DevOps-OS container image to use",
-                       default=os.environ.get(f"{ENV_PREFIX}IMAGE", "ghcr.io/yourorg/devops-os:latest"))
+                       help="DevOps-OS container image to use")
     parser.add_argument("--branches", 
-                       help="Comma-separated list of branches to trigger workflow",
-                       default=os.environ.get(f"{ENV_PREFIX}BRANCHES", "main"))
-    parser.add_argument("--matrix", action="store_true",
-                       help="Enable matrix builds (multiple OS/architectures)",
-                       default=os.environ.get(f"{ENV_PREFIX}MATRIX", "false").lower() in ("true", "1", "yes"))
+                       help="Comma-separated list of branches to trigger workflow")
+    parser.add_argument("--matrix", action="store_true", default=None,
+                       help="Enable matrix builds (multiple OS/architectures)")
     parser.add_argument("--env-file", 
-                       help="Use DevOps-OS devcontainer.env.json for configuration",
-                       default=os.environ.get(f"{ENV_PREFIX}ENV_FILE", ENV_CONFIG_PATH))
-    parser.add_argument("--reusable", action="store_true", 
-                       help="Generate a reusable workflow that can be called from other workflows",
-                       default=os.environ.get(f"{ENV_PREFIX}REUSABLE", "false").lower() in ("true", "1", "yes"))
-    
-    args = parser.parse_args()
+                       help="Use DevOps-OS devcontainer.env.json for configuration")
+    parser.add_argument("--reusable", action="store_true", default=None,
+                       help="Generate a reusable workflow that can be called from other workflows")
+    return parser
+
+_PARSER = _build_parser()
+
+def parse_arguments(argv=None):
+    """Parse command line arguments with environment variable fallbacks."""
+    args = _PARSER.parse_args(argv)
+
+    # Fill omitted options from DEVOPS_OS_GHA_* in a single pass over the environment
+    env = {key[len(ENV_PREFIX):]: value for key, value in os.environ.items()
+           if key.startswith(ENV_PREFIX)}
+    for dest, (suffix, default) in ENV_DEFAULTS.items():
+        if getattr(args, dest) is None:
+            value = env.get(suffix, default)
+            if dest in BOOL_OPTIONS:
+                value = value.lower() in ("true", "1", "yes")
+            setattr(args, dest, value)
     
     # If type is 'reusable', set reusable flag to True
     if args.type == "reusable":
         args.reusable = True
+
+    # Split the trigger branches once for every workflow generator
+    args.branch_list = _branch_list(args)
     
     return args
 
+def _loads_json(raw):
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+@functools.lru_cache(maxsize=32)
+def _read_json_file(path, mtime_ns, size, strip_comments):  # noqa: ARG001
+    """Parse the JSON file at *path*, memoized on its modification time and size.
+
+    ``mtime_ns`` and ``size`` only key the cache, so an edited file is
+    re-read while repeated generations in one process reuse the parsed
+    object. Callers must treat the result as read-only.
+    """
+    raw = Path(path).read_bytes()
+    if strip_comments:
+        # Remove comments that start with // for JSON parsing
+        raw = _LINE_COMMENT_RE.sub("", raw.decode("utf-8"))
+    return _loads_json(raw)
+
+def _load_json_file(file_path, strip_comments=False):
+    """Return the parsed JSON file at *file_path*, or ``{}`` if it is unset or missing."""
+    if not file_path:
+        return {}
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return {}
+    if not S_ISREG(st.st_mode):
+        return {}
+    return _read_json_file(os.path.abspath(file_path), st.st_mtime_ns, st.st_size, strip_comments)
+
 def load_custom_values(file_path):
     """Load custom values from a JSON file."""
-    if file_path and os.path.exists(file_path):
-        with open(file_path, 'r') as f:
-            return json.load(f)
-    return {}
+    return _load_json_file(file_path)
 
 def load_env_config(file_path):
     """Load DevOps-OS environment configuration."""
-    if file_path and os.path.exists(file_path):
-        with open(file_path, 'r') as f:
-            # Remove comments that start with // for JSON parsing
-            lines = f.readlines()
-            cleaned_json = ""
-            for line in lines:
-                if not line.strip().startswith("//"):
-                    cleaned_json += line
-            return json.loads(cleaned_json)
-    return {}
+    return _load_json_file(file_path, strip_comments=True)
 
 def create_directory_structure(output_dir):
     """Create the necessary directory structure."""
@@ -134,7 +211,7 @@ def create_directory_structure(output_dir):
 
 def generate_language_config(languages_str, env_config=None):
     """Generate language configuration JSON."""
-    languages = languages_str.split(',')
+    languages = frozenset(lang.strip().lower() for lang in languages_str.split(','))
     
     # Default to env_config if available, otherwise use languages from args
     if env_config and 'languages' in env_config:
@@ -220,658 +297,649 @@ def generate_devops_tools_config(env_config=None):
         "jenkins": False
     }
 
-def generate_build_workflow(args, values, configs):
-    """Generate a build workflow."""
-    branches = [b.strip() for b in args.branches.split(',')]
-    image = values.get('container_image', args.image)
-    
-    workflow = {
-        "name": f"{args.name} Build",
-        "on": {
-            "push": {
-                "branches": branches
-            },
-            "pull_request": {
-                "branches": branches
-            },
-            "workflow_dispatch": {}
+def build_configs(args, env_config=None):
+    """Build the configuration objects shared by every workflow generator.
+
+    Each config is computed once per run and the resulting dict is passed to
+    ``generate_workflow``, so the build/test/deploy jobs of a complete
+    workflow all read the same objects.
+    """
+    return {
+        "languages": generate_language_config(args.languages, env_config),
+        "kubernetes": generate_kubernetes_config(args.kubernetes, args.k8s_method, env_config),
+        "cicd": generate_cicd_config(env_config),
+        "build_tools": generate_build_tools_config(env_config),
+        "code_analysis": generate_code_analysis_config(env_config),
+        "devops_tools": generate_devops_tools_config(env_config)
+    }
+
+# Environment-selection input shared by deploy-capable workflow_dispatch triggers
+def _deploy_environment_input():
+    return {
+        "description": "Environment to deploy to",
+        "required": True,
+        "default": "dev",
+        "type": "choice",
+        "options": ["dev", "test", "staging", "prod"]
+    }
+
+# Label used in the "Set up ... environment" step of each job phase
+PHASE_LABELS = {
+    "build": "build",
+    "test": "test",
+    "deploy": "deployment",
+    "lint": "lint",
+}
+
+# Matrix strategy applied to every job when --matrix is enabled
+def _matrix_strategy():
+    return {
+        "matrix": {
+            "os": ["ubuntu-latest"],
+            "arch": ["amd64", "arm64"]
         },
-        "jobs": {
-            "build": {
-                "runs-on": "ubuntu-latest",
-                "container": {
-                    "image": image,
-                    "options": "--user root"
-                },
-                "steps": [
-                    {
-                        "name": "Checkout code",
-                        "uses": "actions/checkout@v3"
-                    },
-                    {
-                        "name": "Set up build environment",
-                        "run": "echo 'Setting up build environment for DevOps-OS'"
-                    }
-                ]
-            }
-        }
+        "fail-fast": False
     }
-    
-    # Add matrix strategy if enabled
-    if args.matrix:
-        workflow["jobs"]["build"]["strategy"] = {
-            "matrix": {
-                "os": ["ubuntu-latest"],
-                "arch": ["amd64", "arm64"]
-            },
-            "fail-fast": False
-        }
-        workflow["jobs"]["build"]["runs-on"] = "${{ matrix.os }}"
-    
-    # Add language-specific build steps
-    if configs["languages"].get("python", False):
-        workflow["jobs"]["build"]["steps"].append({
-            "name": "Install Python dependencies",
-            "run": "if [ -f requirements.txt ]; then pip install -r requirements.txt; fi"
-        })
-        workflow["jobs"]["build"]["steps"].append({
-            "name": "Build Python package",
-            "run": "if [ -f setup.py ]; then pip install -e .; fi"
-        })
-    
-    if configs["languages"].get("java", False):
-        workflow["jobs"]["build"]["steps"].append({
-            "name": "Set up Java environment",
-            "run": "echo 'Setting up Java environment'"
-        })
-        workflow["jobs"]["build"]["steps"].append({
-            "name": "Build with Maven",
-            "run": "if [ -f pom.xml ]; then mvn -B package --file pom.xml; fi"
-        })
-        workflow["jobs"]["build"]["steps"].append({
-            "name": "Build with Gradle",
-            "run": "if [ -f build.gradle ]; then ./gradlew build; fi"
-        })
-    
-    if configs["languages"].get("javascript", False):
-        workflow["jobs"]["build"]["steps"].append({
-            "name": "Install Node.js dependencies",
-            "run": "if [ -f package.json ]; then npm ci; fi"
-        })
-        workflow["jobs"]["build"]["steps"].append({
-            "name": "Build JavaScript/TypeScript",
-            "run": "if [ -f package.json ]; then npm run build --if-present; fi"
-        })
-    
-    if configs["languages"].get("go", False):
-        workflow["jobs"]["build"]["steps"].append({
-            "name": "Build Go application",
-            "run": "if [ -f go.mod ]; then go build -v ./...; fi"
-        })
-    
-    # Add code analysis if enabled
-    if configs.get("code_analysis", {}).get("sonarqube", False):
-        workflow["jobs"]["build"]["steps"].append({
-            "name": "SonarQube Analysis",
-            "run": "echo 'Running SonarQube analysis'"
-        })
-    
-    # Add artifact upload
-    artifact_suffix = ""
-    if args.matrix:
-        artifact_suffix = "-${{ matrix.os }}-${{ matrix.arch }}"
-        
-    workflow["jobs"]["build"]["steps"].append({
-        "name": "Upload build artifacts",
-        "uses": "actions/upload-artifact@v3",
-        "with": {
-            "name": f"build-artifacts{artifact_suffix}",
-            "path": values.get("artifact_path", "dist/"),
-            "retention-days": 1
-        }
-    })
-    
-    return workflow
 
-def generate_test_workflow(args, values, configs):
-    """Generate a test workflow."""
-    branches = [b.strip() for b in args.branches.split(',')]
-    image = values.get('container_image', args.image)
-    
-    workflow = {
-        "name": f"{args.name} Test",
-        "on": {
-            "push": {
-                "branches": branches
-            },
-            "pull_request": {
-                "branches": branches
-            },
-            "workflow_dispatch": {}
+def _branch_list(args):
+    """Return the trigger branches from the comma-separated ``--branches`` value.
+
+    ``parse_arguments`` stores the split list on ``args.branch_list``; callers
+    that build their own Namespace (tests, the MCP server) fall back to
+    splitting ``args.branches`` here.
+    """
+    branch_list = getattr(args, "branch_list", None)
+    if branch_list is None:
+        branch_list = [b.strip() for b in args.branches.split(',')]
+    return branch_list
+
+# Changes that never affect the build; a push or pull request touching only
+# these paths does not start the workflow
+PATHS_IGNORE = ("**/*.md", "docs/**", ".gitignore")
+
+def _triggers(branches, pull_request=True, environment_input=False, paths_ignore=PATHS_IGNORE):
+    """Build the ``on:`` block shared by the build/test/deploy/complete workflows."""
+    triggers = {"push": {"branches": branches, "paths-ignore": list(paths_ignore)}}
+    if pull_request:
+        triggers["pull_request"] = {"branches": branches, "paths-ignore": list(paths_ignore)}
+    if environment_input:
+        triggers["workflow_dispatch"] = {"inputs": {"environment": _deploy_environment_input()}}
+    else:
+        triggers["workflow_dispatch"] = {}
+    return triggers
+
+# actions/cache steps for each language's package manager, keyed by language
+def _dependency_cache_steps():
+    return {
+        "python": {
+            "name": "Cache pip packages",
+            "uses": "actions/cache@v4",
+            "with": {
+                "path": "~/.cache/pip",
+                "key": "${{ runner.os }}-pip-${{ hashFiles('**/requirements.txt', '**/pyproject.toml') }}",
+                "restore-keys": "${{ runner.os }}-pip-"
+            }
         },
-        "jobs": {
-            "test": {
-                "runs-on": "ubuntu-latest",
-                "container": {
-                    "image": image,
-                    "options": "--user root"
-                },
-                "steps": [
-                    {
-                        "name": "Checkout code",
-                        "uses": "actions/checkout@v3"
-                    },
-                    {
-                        "name": "Set up test environment",
-                        "run": "echo 'Setting up test environment for DevOps-OS'"
-                    }
-                ]
+        "java": {
+            "name": "Cache Maven and Gradle packages",
+            "uses": "actions/cache@v4",
+            "with": {
+                "path": "~/.m2\n~/.gradle/caches",
+                "key": "${{ runner.os }}-mvn-gradle-${{ hashFiles('**/pom.xml', '**/build.gradle') }}",
+                "restore-keys": "${{ runner.os }}-mvn-gradle-"
             }
-        }
+        },
+        "javascript": {
+            "name": "Cache npm packages",
+            "uses": "actions/cache@v4",
+            "with": {
+                "path": "~/.npm",
+                "key": "${{ runner.os }}-npm-${{ hashFiles('**/package-lock.json') }}",
+                "restore-keys": "${{ runner.os }}-npm-"
+            }
+        },
+        "go": {
+            "name": "Cache Go modules",
+            "uses": "actions/cache@v4",
+            "with": {
+                "path": "~/go/pkg/mod\n~/.cache/go-build",
+                "key": "${{ runner.os }}-go-${{ hashFiles('**/go.sum') }}",
+                "restore-keys": "${{ runner.os }}-go-"
+            }
+        },
     }
-    
-    # Add matrix strategy if enabled
-    if args.matrix:
-        workflow["jobs"]["test"]["strategy"] = {
-            "matrix": {
-                "os": ["ubuntu-latest"],
-                "arch": ["amd64", "arm64"]
-            },
-            "fail-fast": False
-        }
-        workflow["jobs"]["test"]["runs-on"] = "${{ matrix.os }}"
-    
-    # Add language-specific test steps
-    if configs["languages"].get("python", False):
-        workflow["jobs"]["test"]["steps"].append({
-            "name": "Install Python dependencies",
-            "run": "if [ -f requirements.txt ]; then pip install -r requirements.txt pytest pytest-cov; fi"
-        })
-        workflow["jobs"]["test"]["steps"].append({
-            "name": "Run Python tests",
-            "run": "if [ -d tests ]; then python -m pytest --cov=./ --cov-report=xml; fi"
-        })
-        if configs.get("code_analysis", {}).get("pylint", False):
-            workflow["jobs"]["test"]["steps"].append({
+
+def _enabled_languages(configs):
+    """Return the set of languages switched on in ``configs["languages"]``."""
+    return frozenset(language for language, enabled in configs["languages"].items() if enabled)
+
+def _add_dependency_caches(job, enabled_languages):
+    """Insert package-manager cache steps right after the checkout step of *job*."""
+    cache_steps = [
+        step for language, step in _dependency_cache_steps().items()
+        if language in enabled_languages
+    ]
+    job["steps"][1:1] = cache_steps
+    return job
+
+# First two steps of every job: checkout, then the per-phase environment setup
+def _checkout_step():
+    return {
+        "name": "Checkout code",
+        "uses": "actions/checkout@v3"
+    }
+
+def _setup_step(phase):
+    label = PHASE_LABELS[phase]
+    return {
+        "name": f"Set up {label} environment",
+        "run": f"echo 'Setting up {label} environment for DevOps-OS'"
+    }
+
+def _container_image(args, values):
+    """Return the job container image, pinned by digest when one is configured.
+
+    A ``container_image_digest`` custom value (``sha256:...``) replaces the
+    image tag, so every job pulls the exact same image and runners can reuse
+    their cached layers for it.
+    """
+    image = values.get('container_image', args.image)
+    digest = values.get('container_image_digest')
+    if not digest:
+        return image
+    name = image.split('@', 1)[0]
+    if ':' in name.rsplit('/', 1)[-1]:
+        name = name.rsplit(':', 1)[0]
+    return f"{name}@{digest}"
+
+def _job_skeleton(phase, image, needs=None, condition=None, matrix=False):
+    """Build the DevOps-OS container job skeleton every workflow job starts from.
+
+    With *matrix* the job runs on the ``_matrix_strategy()`` matrix.
+    """
+    job = {}
+    if needs:
+        job["needs"] = list(needs)
+    if condition:
+        job["if"] = condition
+    job["runs-on"] = "ubuntu-latest"
+    job["container"] = {
+        "image": image,
+        "options": "--user root"
+    }
+    job["steps"] = [_checkout_step(), _setup_step(phase)]
+    if matrix:
+        job["strategy"] = _matrix_strategy()
+        job["runs-on"] = "${{ matrix.os }}"
+    return job
+
+def _needs_container(steps):
+    """Return True if any step runs a command beyond ``echo``.
+
+    Actions (``uses:``) and echo-only scripts run just as well on the bare
+    runner, so a job made only of those does not need the DevOps-OS image.
+    """
+    return any(
+        "run" in step
+        and not all(line.startswith("echo ") for line in step["run"].splitlines())
+        for step in steps
+    )
+
+def _drop_unused_container(job):
+    """Remove ``container:`` from *job* when none of its steps need the image."""
+    if not _needs_container(job["steps"]):
+        del job["container"]
+    return job
+
+# Ordered per-phase steps: (language or None, code_analysis tool or None, step).
+# A step is emitted when its language is enabled (or None) and its analysis
+# tool is enabled (or None).
+def _phase_step_rules():
+    return {
+        "build": (
+            ("python", None, {
+                "name": "Install Python dependencies",
+                "run": "if [ -f requirements.txt ]; then pip install -r requirements.txt; fi"
+            }),
+            ("python", None, {
+                "name": "Build Python package",
+                "run": "if [ -f setup.py ]; then pip install -e .; elif [ -f pyproject.toml ]; then pip install -e .; fi"
+            }),
+            ("java", None, {
+                "name": "Set up Java environment",
+                "run": "echo 'Setting up Java environment'"
+            }),
+            ("java", None, {
+                "name": "Build with Maven",
+                "run": "if [ -f pom.xml ]; then mvn -B package --file pom.xml; fi"
+            }),
+            ("java", None, {
+                "name": "Build with Gradle",
+                "run": "if [ -f build.gradle ]; then ./gradlew build; fi"
+            }),
+            ("javascript", None, {
+                "name": "Install Node.js dependencies",
+                "run": "if [ -f package.json ]; then npm ci; fi"
+            }),
+            ("javascript", None, {
+                "name": "Build JavaScript/TypeScript",
+                "run": "if [ -f package.json ]; then npm run build --if-present; fi"
+            }),
+            ("go", None, {
+                "name": "Build Go application",
+                "run": "if [ -f go.mod ]; then go build -v ./...; fi"
+            }),
+            (None, "sonarqube", {
+                "name": "SonarQube Analysis",
+                "run": "echo 'Running SonarQube analysis'"
+            }),
+        ),
+        "test": (
+            ("python", None, {
+                "name": "Install Python dependencies",
+                "run": "if [ -f requirements.txt ]; then pip install -r requirements.txt pytest pytest-cov; fi"
+            }),
+            ("python", None, {
+                "name": "Run Python tests",
+                "run": "if [ -d tests ]; then python -m pytest --cov=./ --cov-report=xml; fi"
+            }),
+            ("python", "pylint", {
                 "name": "Run Pylint",
                 "run": "if command -v pylint &> /dev/null; then pylint --disable=C0111 **/*.py; fi"
-            })
-    
-    if configs["languages"].get("java", False):
-        workflow["jobs"]["test"]["steps"].append({
-            "name": "Set up Java environment",
-            "run": "echo 'Setting up Java environment'"
-        })
-        workflow["jobs"]["test"]["steps"].append({
-            "name": "Run Java tests with Maven",
-            "run": "if [ -f pom.xml ]; then mvn -B test --file pom.xml; fi"
-        })
-        workflow["jobs"]["test"]["steps"].append({
-            "name": "Run Java tests with Gradle",
-            "run": "if [ -f build.gradle ]; then ./gradlew test; fi"
-        })
-        if configs.get("code_analysis", {}).get("checkstyle", False):
-            workflow["jobs"]["test"]["steps"].append({
+            }),
+            ("java", None, {
+                "name": "Set up Java environment",
+                "run": "echo 'Setting up Java environment'"
+            }),
+            ("java", None, {
+                "name": "Run Java tests with Maven",
+                "run": "if [ -f pom.xml ]; then mvn -B test --file pom.xml; fi"
+            }),
+            ("java", None, {
+                "name": "Run Java tests with Gradle",
+                "run": "if [ -f build.gradle ]; then ./gradlew test; fi"
+            }),
+            ("java", "checkstyle", {
                 "name": "Run Checkstyle",
                 "run": "if [ -f pom.xml ]; then mvn checkstyle:checkstyle; fi"
-            })
-    
-    if configs["languages"].get("javascript", False):
-        workflow["jobs"]["test"]["steps"].append({
-            "name": "Install Node.js dependencies",
-            "run": "if [ -f package.json ]; then npm ci; fi"
-        })
-        workflow["jobs"]["test"]["steps"].append({
-            "name": "Run JavaScript tests",
-            "run": "if [ -f package.json ]; then npm test; fi"
-        })
-        if configs.get("code_analysis", {}).get("eslint", False):
-            workflow["jobs"]["test"]["steps"].append({
+            }),
+            ("javascript", None, {
+                "name": "Install Node.js dependencies",
+                "run": "if [ -f package.json ]; then npm ci; fi"
+            }),
+            ("javascript", None, {
+                "name": "Run JavaScript tests",
+                "run": "if [ -f package.json ]; then npm test; fi"
+            }),
+            ("javascript", "eslint", {
                 "name": "Run ESLint",
                 "run": "if [ -f package.json ] && grep -q eslint package.json; then npm run lint; fi"
-            })
-    
-    if configs["languages"].get("go", False):
-        workflow["jobs"]["test"]["steps"].append({
-            "name": "Run Go tests",
-            "run": "if [ -f go.mod ]; then go test -v ./...; fi"
-        })
-    
-    # Add test report
-    artifact_suffix = ""
-    if args.matrix:
-        artifact_suffix = "-${{ matrix.os }}-${{ matrix.arch }}"
-        
-    workflow["jobs"]["test"]["steps"].append({
-        "name": "Upload test results",
-        "uses": "actions/upload-artifact@v3",
-        "with": {
-            "name": f"test-results{artifact_suffix}",
-            "path": values.get("test_report_path", "test-reports/"),
-            "retention-days": 1
-        }
-    })
-    
-    workflow["jobs"]["test"]["steps"].append({
+            }),
+            ("go", None, {
+                "name": "Run Go tests",
+                "run": "if [ -f go.mod ]; then go test -v ./...; fi"
+            }),
+        ),
+    }
+
+def _phase_steps(phase, configs, enabled_languages):
+    """Return the language and code-analysis steps enabled for *phase*."""
+    analysis = configs.get("code_analysis", {})
+    return [
+        step for language, tool, step in _phase_step_rules()[phase]
+        if (language is None or language in enabled_languages)
+        and (tool is None or analysis.get(tool, False))
+    ]
+
+def _coverage_upload_step():
+    return {
         "name": "Upload coverage reports",
         "uses": "codecov/codecov-action@v3",
         "with": {
             "files": "./coverage.xml,./coverage/lcov.info",
             "fail_ci_if_error": False
         }
-    })
-    
-    return workflow
+    }
 
-def generate_deploy_workflow(args, values, configs):
-    """Generate a deployment workflow."""
-    branches = [b.strip() for b in args.branches.split(',')]
-    image = values.get('container_image', args.image)
-    
-    workflow = {
-        "name": f"{args.name} Deploy",
-        "on": {
-            "push": {
-                "branches": branches
-            },
-            "workflow_dispatch": {
-                "inputs": {
-                    "environment": {
-                        "description": "Environment to deploy to",
-                        "required": True,
-                        "default": "dev",
-                        "type": "choice",
-                        "options": ["dev", "test", "staging", "prod"]
-                    }
-                }
+def _analysis_steps(configs, enabled_languages):
+    """Return the code-analysis steps of every phase, for a standalone lint job."""
+    analysis = configs.get("code_analysis", {})
+    return [
+        step for phase_steps in _phase_step_rules().values()
+        for language, tool, step in phase_steps
+        if tool is not None and analysis.get(tool, False)
+        and (language is None or language in enabled_languages)
+    ]
+
+def _artifact_steps(phase, args, values):
+    """Return the artifact/report upload steps that close a build or test job."""
+    artifact_suffix = ""
+    if args.matrix:
+        artifact_suffix = "-${{ matrix.os }}-${{ matrix.arch }}"
+
+    if phase == "build":
+        return [{
+            "name": "Upload build artifacts",
+            "uses": "actions/upload-artifact@v3",
+            "with": {
+                "name": f"build-artifacts{artifact_suffix}",
+                "path": values.get("artifact_path", "dist/"),
+                "retention-days": 1
+            }
+        }]
+
+    return [
+        {
+            "name": "Upload test results",
+            "uses": "actions/upload-artifact@v3",
+            "with": {
+                "name": f"test-results{artifact_suffix}",
+                "path": values.get("test_report_path", "test-reports/"),
+                "retention-days": 1
             }
         },
-        "jobs": {
-            "deploy": {
-                "runs-on": "ubuntu-latest",
-                "container": {
-                    "image": image,
-                    "options": "--user root"
-                },
-                "steps": [
-                    {
-                        "name": "Checkout code",
-                        "uses": "actions/checkout@v3"
-                    },
-                    {
-                        "name": "Set up deployment environment",
-                        "run": "echo 'Setting up deployment environment for DevOps-OS'"
-                    },
-                    {
-                        "name": "Build and Push Docker Image",
-                        "if": "github.ref == 'refs/heads/main'",
-                        "run": "\n".join([
-                            "echo \"${{ secrets.REGISTRY_TOKEN }}\" | docker login " + args.registry + " -u ${{ github.actor }} --password-stdin",
-                            "docker build -t " + args.registry + "/${{ github.repository_owner }}/${{ github.event.repository.name }}:latest .",
-                            "docker push " + args.registry + "/${{ github.repository_owner }}/${{ github.event.repository.name }}:latest"
-                        ])
-                    }
-                ]
+        _coverage_upload_step(),
+    ]
+
+# Repository image reference pushed to the --registry by the deploy jobs
+IMAGE_PATH = "${{ github.repository_owner }}/${{ github.event.repository.name }}:latest"
+
+# Docker steps only run for pushes to main
+MAIN_BRANCH_CONDITION = "github.ref == 'refs/heads/main'"
+
+def _setup_buildx_step():
+    return {
+        "name": "Set up Docker Buildx",
+        "if": MAIN_BRANCH_CONDITION,
+        "uses": "docker/setup-buildx-action@v3"
+    }
+
+def _docker_build_push_steps(registry, token_secret):
+    """Return the Buildx steps that build the repository image and push it to *registry*.
+
+    Image layers are cached in the GitHub Actions cache (``type=gha``) so
+    unchanged layers are restored on later runs instead of rebuilt.
+    """
+    return [
+        _setup_buildx_step(),
+        {
+            "name": "Log in to container registry",
+            "if": MAIN_BRANCH_CONDITION,
+            "uses": "docker/login-action@v3",
+            "with": {
+                "registry": registry,
+                "username": "${{ github.actor }}",
+                "password": f"${{{{ secrets.{token_secret} }}}}"
             }
-        }
+        },
+        {
+            "name": "Build and Push Docker Image",
+            "if": MAIN_BRANCH_CONDITION,
+            "uses": "docker/build-push-action@v5",
+            "with": {
+                "context": ".",
+                "push": True,
+                "tags": f"{registry}/{IMAGE_PATH}",
+                "cache-from": "type=gha",
+                "cache-to": "type=gha,mode=max"
+            }
+        },
+    ]
+
+def _kubeconfig_step(secret, condition):
+    """Return the step writing the *secret* kubeconfig for the kubectl-based methods."""
+    return {
+        "name": "Set up kubeconfig",
+        "if": condition,
+        "run": (
+            "mkdir -p $HOME/.kube\n"
+            f"echo \"${{{{ secrets.{secret} }}}}\" > $HOME/.kube/config\n"
+            "chmod 600 $HOME/.kube/config"
+        )
     }
-    
-    # Add Kubernetes deployment steps if enabled
-    if args.kubernetes:
-        if args.k8s_method == "kubectl":
-            workflow["jobs"]["deploy"]["steps"].append({
-                "name": "Deploy to Kubernetes",
-                "if": "github.ref == 'refs/heads/main'",
-                "run": "\n".join([
-                    "mkdir -p $HOME/.kube",
-                    "echo \"${{ secrets.KUBECONFIG }}\" > $HOME/.kube/config",
-                    "chmod 600 $HOME/.kube/config",
-                    "kubectl apply -f ./k8s/deployment.yaml",
-                    "kubectl apply -f ./k8s/service.yaml",
-                    "kubectl rollout status deployment/my-app"
-                ])
-            })
-        elif args.k8s_method == "kustomize":
-            workflow["jobs"]["deploy"]["steps"].append({
-                "name": "Deploy to Kubernetes with Kustomize",
-                "if": "github.ref == 'refs/heads/main'",
-                "run": "\n".join([
-                    "mkdir -p $HOME/.kube",
-                    "echo \"${{ secrets.KUBECONFIG }}\" > $HOME/.kube/config",
-                    "chmod 600 $HOME/.kube/config",
-                    "kubectl apply -k ./k8s/overlays/${ENVIRONMENT}",
-                    "kubectl rollout status deployment/my-app"
-                ]),
-                "env": {
-                    "ENVIRONMENT": "${{ github.event.inputs.environment || 'dev' }}"
-                }
-            })
-        elif args.k8s_method == "argocd":
-            workflow["jobs"]["deploy"]["steps"].append({
-                "name": "Deploy with ArgoCD",
-                "if": "github.ref == 'refs/heads/main'",
-                "run": "\n".join([
-                    "argocd login $ARGOCD_SERVER --username $ARGOCD_USERNAME --password $ARGOCD_PASSWORD --insecure",
-                    "argocd app sync my-application",
-                    "argocd app wait my-application --health"
-                ]),
-                "env": {
-                    "ARGOCD_SERVER": "${{ secrets.ARGOCD_SERVER }}",
-                    "ARGOCD_USERNAME": "${{ secrets.ARGOCD_USERNAME }}",
-                    "ARGOCD_PASSWORD": "${{ secrets.ARGOCD_PASSWORD }}"
-                }
-            })
-        elif args.k8s_method == "flux":
-            workflow["jobs"]["deploy"]["steps"].append({
-                "name": "Deploy with Flux",
-                "if": "github.ref == 'refs/heads/main'",
-                "run": "\n".join([
-                    "flux reconcile source git flux-system",
-                    "flux reconcile kustomization flux-system"
-                ])
-            })
-    
-    return workflow
 
-def generate_complete_workflow(args, values, configs):
-    """Generate a complete CI/CD workflow."""
-    branches = [b.strip() for b in args.branches.split(',')]
-    image = values.get('container_image', args.image)
-    
-    workflow = {
-        "name": f"{args.name} CI/CD",
-        "on": {
-            "push": {
-                "branches": branches
-            },
-            "pull_request": {
-                "branches": branches
-            },
-            "workflow_dispatch": {
-                "inputs": {
-                    "environment": {
-                        "description": "Environment to deploy to",
-                        "required": True,
-                        "default": "dev",
-                        "type": "choice",
-                        "options": ["dev", "test", "staging", "prod"]
-                    }
-                }
+# Deploy methods that talk to the cluster through $HOME/.kube/config
+KUBECONFIG_METHODS = frozenset({"kubectl", "kustomize"})
+
+# Kubernetes deploy step for each --k8s-method
+def _k8s_deploy_steps():
+    return {
+        "kubectl": {
+            "name": "Deploy to Kubernetes",
+            "if": "github.ref == 'refs/heads/main'",
+            "run": (
+                "kubectl apply -f ./k8s/deployment.yaml -f ./k8s/service.yaml\n"
+                "kubectl rollout status deployment/my-app"
+            )
+        },
+        "kustomize": {
+            "name": "Deploy to Kubernetes with Kustomize",
+            "if": "github.ref == 'refs/heads/main'",
+            "run": (
+                "kubectl apply -k ./k8s/overlays/${ENVIRONMENT}\n"
+                "kubectl rollout status deployment/my-app"
+            ),
+            "env": {
+                "ENVIRONMENT": "${{ github.event.inputs.environment || 'dev' }}"
             }
         },
-        "jobs": {
-            "build": {
-                "runs-on": "ubuntu-latest",
-                "container": {
-                    "image": image,
-                    "options": "--user root"
-                },
-                "steps": [
-                    {
-                        "name": "Checkout code",
-                        "uses": "actions/checkout@v3"
-                    },
-                    {
-                        "name": "Set up build environment",
-                        "run": "echo 'Setting up build environment for DevOps-OS'"
-                    }
-                ]
-            },
-            "test": {
-                "needs": ["build"],
-                "runs-on": "ubuntu-latest",
-                "container": {
-                    "image": image,
-                    "options": "--user root"
-                },
-                "steps": [
-                    {
-                        "name": "Checkout code",
-                        "uses": "actions/checkout@v3"
-                    },
-                    {
-                        "name": "Set up test environment",
-                        "run": "echo 'Setting up test environment for DevOps-OS'"
-                    }
-                ]
-            },
-            "deploy": {
-                "needs": ["test"],
-                "if": "github.ref == 'refs/heads/main'",
-                "runs-on": "ubuntu-latest",
-                "container": {
-                    "image": image,
-                    "options": "--user root"
-                },
-                "steps": [
-                    {
-                        "name": "Checkout code",
-                        "uses": "actions/checkout@v3"
-                    },
-                    {
-                        "name": "Set up deployment environment",
-                        "run": "echo 'Setting up deployment environment for DevOps-OS'"
-                    }
-                ]
+        "argocd": {
+            "name": "Deploy with ArgoCD",
+            "if": "github.ref == 'refs/heads/main'",
+            "run": (
+                "argocd login $ARGOCD_SERVER --username $ARGOCD_USERNAME --password $ARGOCD_PASSWORD --insecure\n"
+                "argocd app sync $ARGOCD_APPS --async\n"
+                "argocd app wait $ARGOCD_APPS --health"
+            ),
+            "env": {
+                "ARGOCD_SERVER": "${{ secrets.ARGOCD_SERVER }}",
+                "ARGOCD_USERNAME": "${{ secrets.ARGOCD_USERNAME }}",
+                "ARGOCD_PASSWORD": "${{ secrets.ARGOCD_PASSWORD }}"
             }
+        },
+        "flux": {
+            "name": "Deploy with Flux",
+            "if": "github.ref == 'refs/heads/main'",
+            "run": (
+                "flux reconcile source git flux-system\n"
+                "flux reconcile kustomization flux-system"
+            )
         }
     }
-    
-    # Add matrix strategy if enabled
-    if args.matrix:
-        for job in ["build", "test", "deploy"]:
-            workflow["jobs"][job]["strategy"] = {
-                "matrix": {
-                    "os": ["ubuntu-latest"],
-                    "arch": ["amd64", "arm64"]
-                },
-                "fail-fast": False
-            }
-            workflow["jobs"][job]["runs-on"] = "${{ matrix.os }}"
-    
-    # Add language-specific build steps
-    if configs["languages"].get("python", False):
-        workflow["jobs"]["build"]["steps"].append({
-            "name": "Install Python dependencies",
-            "run": "if [ -f requirements.txt ]; then pip install -r requirements.txt; fi"
-        })
-        workflow["jobs"]["build"]["steps"].append({
-            "name": "Build Python package",
-            "run": "if [ -f setup.py ]; then pip install -e .; elif [ -f pyproject.toml ]; then pip install -e .; fi"
-        })
-    
-    if configs["languages"].get("java", False):
-        workflow["jobs"]["build"]["steps"].append({
-            "name": "Set up Java environment",
-            "run": "echo 'Setting up Java environment'"
-        })
-        workflow["jobs"]["build"]["steps"].append({
-            "name": "Build with Maven",
-            "run": "if [ -f pom.xml ]; then mvn -B package --file pom.xml; fi"
-        })
-        workflow["jobs"]["build"]["steps"].append({
-            "name": "Build with Gradle",
-            "run": "if [ -f build.gradle ]; then ./gradlew build; fi"
-        })
-    
-    if configs["languages"].get("javascript", False):
-        workflow["jobs"]["build"]["steps"].append({
-            "name": "Install Node.js dependencies",
-            "run": "if [ -f package.json ]; then npm ci; fi"
-        })
-        workflow["jobs"]["build"]["steps"].append({
-            "name": "Build JavaScript/TypeScript",
-            "run": "if [ -f package.json ]; then npm run build --if-present; fi"
-        })
-    
-    if configs["languages"].get("go", False):
-        workflow["jobs"]["build"]["steps"].append({
-            "name": "Build Go application",
-            "run": "if [ -f go.mod ]; then go build -v ./...; fi"
-        })
-    
-    # Add artifact upload for build
-    artifact_suffix = ""
-    if args.matrix:
-        artifact_suffix = "-${{ matrix.os }}-${{ matrix.arch }}"
-        
-    workflow["jobs"]["build"]["steps"].append({
-        "name": "Upload build artifacts",
-        "uses": "actions/upload-artifact@v3",
-        "with": {
-            "name": f"build-artifacts{artifact_suffix}",
-            "path": values.get("artifact_path", "dist/"),
-            "retention-days": 1
+
+# ArgoCD applications synced by the deploy jobs, unless overridden by the
+# ``argocd_apps`` custom value
+DEFAULT_ARGOCD_APPS = ("my-application",)
+
+def _with_argocd_apps(step, values):
+    """Return *step* with ``ARGOCD_APPS`` set, so one sync/wait call covers every app.
+
+    ``argocd_apps`` may be a list or a comma-separated string; an empty value
+    falls back to ``DEFAULT_ARGOCD_APPS`` so the sync never runs without apps.
+    """
+    apps = values.get("argocd_apps") or DEFAULT_ARGOCD_APPS
+    if isinstance(apps, str):
+        apps = apps.split(",")
+    apps = " ".join(app.strip() for app in apps if app.strip()) or " ".join(DEFAULT_ARGOCD_APPS)
+    return {**step, "env": {**step.get("env", {}), "ARGOCD_APPS": apps}}
+
+def _deploy_steps(args, values):
+    """Return the image build/push steps plus the Kubernetes step for ``--k8s-method``."""
+    steps = _docker_build_push_steps(args.registry, "REGISTRY_TOKEN")
+
+    if not args.kubernetes:
+        return steps
+
+    if args.k8s_method in KUBECONFIG_METHODS:
+        steps.append(_kubeconfig_step("KUBECONFIG", MAIN_BRANCH_CONDITION))
+    k8s_step = _k8s_deploy_steps().get(args.k8s_method)
+    if args.k8s_method == "argocd":
+        k8s_step = _with_argocd_apps(k8s_step, values)
+    if k8s_step is not None:
+        steps.append(k8s_step)
+
+    return steps
+
+def _compose_job(phase, args, values, configs, needs=None, condition=None, matrix=False):
+    """Compose the complete job for *phase* (``build``, ``test`` or ``deploy``)."""
+    image = _container_image(args, values)
+    job = _job_skeleton(phase, image, needs=needs, condition=condition, matrix=matrix)
+
+    if phase == "deploy":
+        job["steps"].extend(_deploy_steps(args, values))
+        return _drop_unused_container(job)
+
+    # Resolve the language flags once for the cache and phase-step tables
+    enabled_languages = _enabled_languages(configs)
+    _add_dependency_caches(job, enabled_languages)
+    job["steps"].extend(_phase_steps(phase, configs, enabled_languages)
+                        + _artifact_steps(phase, args, values))
+    return _drop_unused_container(job)
+
+# One run per workflow and ref; a newer push cancels the superseded run
+def _concurrency():
+    return {
+        "group": "${{ github.workflow }}-${{ github.ref }}",
+        "cancel-in-progress": True
+    }
+
+# Workflows that deploy never cancel a run on main part-way through a rollout
+def _deploy_concurrency():
+    return {
+        "group": "${{ github.workflow }}-${{ github.ref }}",
+        "cancel-in-progress": "${{ github.ref != 'refs/heads/main' }}"
+    }
+
+def generate_build_workflow(args, values, configs):
+    """Generate a build workflow."""
+    return {
+        "name": f"{args.name} Build",
+        "on": _triggers(_branch_list(args),
+                        paths_ignore=values.get("paths_ignore", PATHS_IGNORE)),
+        "concurrency": _concurrency(),
+        "jobs": {
+            "build": _compose_job("build", args, values, configs, matrix=args.matrix)
         }
-    })
-    
-    # Add language-specific test steps
-    if configs["languages"].get("python", False):
-        workflow["jobs"]["test"]["steps"].append({
-            "name": "Install Python dependencies",
-            "run": "if [ -f requirements.txt ]; then pip install -r requirements.txt pytest pytest-cov; fi"
-        })
-        workflow["jobs"]["test"]["steps"].append({
-            "name": "Run Python tests",
-            "run": "if [ -d tests ]; then python -m pytest --cov=./ --cov-report=xml; fi"
-        })
-        if configs.get("code_analysis", {}).get("pylint", False):
-            workflow["jobs"]["test"]["steps"].append({
-                "name": "Run Pylint",
-                "run": "if command -v pylint &> /dev/null; then pylint --disable=C0111 **/*.py; fi"
-            })
-    
-    if configs["languages"].get("java", False):
-        workflow["jobs"]["test"]["steps"].append({
-            "name": "Set up Java environment",
-            "run": "echo 'Setting up Java environment'"
-        })
-        workflow["jobs"]["test"]["steps"].append({
-            "name": "Run Java tests with Maven",
-            "run": "if [ -f pom.xml ]; then mvn -B test --file pom.xml; fi"
-        })
-        workflow["jobs"]["test"]["steps"].append({
-            "name": "Run Java tests with Gradle",
-            "run": "if [ -f build.gradle ]; then ./gradlew test; fi"
-        })
-        if configs.get("code_analysis", {}).get("checkstyle", False):
-            workflow["jobs"]["test"]["steps"].append({
-                "name": "Run Checkstyle",
-                "run": "if [ -f pom.xml ]; then mvn checkstyle:checkstyle; fi"
-            })
-    
-    if configs["languages"].get("javascript", False):
-        workflow["jobs"]["test"]["steps"].append({
-            "name": "Install Node.js dependencies",
-            "run": "if [ -f package.json ]; then npm ci; fi"
-        })
-        workflow["jobs"]["test"]["steps"].append({
-            "name": "Run JavaScript tests",
-            "run": "if [ -f package.json ]; then npm test; fi"
-        })
-        if configs.get("code_analysis", {}).get("eslint", False):
-            workflow["jobs"]["test"]["steps"].append({
-                "name": "Run ESLint",
-                "run": "if [ -f package.json ] && grep -q eslint package.json; then npm run lint; fi"
-            })
-    
-    if configs["languages"].get("go", False):
-        workflow["jobs"]["test"]["steps"].append({
-            "name": "Run Go tests",
-            "run": "if [ -f go.mod ]; then go test -v ./...; fi"
-        })
-    
-    # Add test report
-    workflow["jobs"]["test"]["steps"].append({
-        "name": "Upload test results",
-        "uses": "actions/upload-artifact@v3",
-        "with": {
-            "name": f"test-results{artifact_suffix}",
-            "path": values.get("test_report_path", "test-reports/"),
-            "retention-days": 1
+    }
+
+def generate_test_workflow(args, values, configs):
+    """Generate a test workflow."""
+    return {
+        "name": f"{args.name} Test",
+        "on": _triggers(_branch_list(args),
+                        paths_ignore=values.get("paths_ignore", PATHS_IGNORE)),
+        "concurrency": _concurrency(),
+        "jobs": {
+            "test": _compose_job("test", args, values, configs, matrix=args.matrix)
         }
-    })
-    
-    workflow["jobs"]["test"]["steps"].append({
-        "name": "Upload coverage reports",
-        "uses": "codecov/codecov-action@v3",
-        "with": {
-            "files": "./coverage.xml,./coverage/lcov.info",
-            "fail_ci_if_error": False
+    }
+
+def generate_deploy_workflow(args, values, configs):
+    """Generate a deployment workflow."""
+    return {
+        "name": f"{args.name} Deploy",
+        "on": _triggers(_branch_list(args), pull_request=False, environment_input=True,
+                        paths_ignore=values.get("paths_ignore", PATHS_IGNORE)),
+        "concurrency": _deploy_concurrency(),
+        "jobs": {
+            "deploy": _compose_job("deploy", args, values, configs)
         }
-    })
-    
-    # Add deployment steps
-    workflow["jobs"]["deploy"]["steps"].append({
-        "name": "Build and Push Docker Image",
-        "if": "github.ref == 'refs/heads/main'",
-        "run": "\n".join([
-            "echo \"${{ secrets.REGISTRY_TOKEN }}\" | docker login " + args.registry + " -u ${{ github.actor }} --password-stdin",
-            "docker build -t " + args.registry + "/${{ github.repository_owner }}/${{ github.event.repository.name }}:latest .",
-            "docker push " + args.registry + "/${{ github.repository_owner }}/${{ github.event.repository.name }}:latest"
-        ])
-    })
-    
-    # Add Kubernetes deployment steps if enabled
-    if args.kubernetes:
-        if args.k8s_method == "kubectl":
-            workflow["jobs"]["deploy"]["steps"].append({
-                "name": "Deploy to Kubernetes",
-                "if": "github.ref == 'refs/heads/main'",
-                "run": "\n".join([
-                    "mkdir -p $HOME/.kube",
-                    "echo \"${{ secrets.KUBECONFIG }}\" > $HOME/.kube/config",
-                    "chmod 600 $HOME/.kube/config",
-                    "kubectl apply -f ./k8s/deployment.yaml",
-                    "kubectl apply -f ./k8s/service.yaml",
-                    "kubectl rollout status deployment/my-app"
-                ])
-            })
-        elif args.k8s_method == "kustomize":
-            workflow["jobs"]["deploy"]["steps"].append({
-                "name": "Deploy to Kubernetes with Kustomize",
-                "if": "github.ref == 'refs/heads/main'",
-                "run": "\n".join([
-                    "mkdir -p $HOME/.kube",
-                    "echo \"${{ secrets.KUBECONFIG }}\" > $HOME/.kube/config",
-                    "chmod 600 $HOME/.kube/config",
-                    "kubectl apply -k ./k8s/overlays/${ENVIRONMENT}",
-                    "kubectl rollout status deployment/my-app"
-                ]),
-                "env": {
-                    "ENVIRONMENT": "${{ github.event.inputs.environment || 'dev' }}"
-                }
-            })
-        elif args.k8s_method == "argocd":
-            workflow["jobs"]["deploy"]["steps"].append({
-                "name": "Deploy with ArgoCD",
-                "if": "github.ref == 'refs/heads/main'",
-                "run": "\n".join([
-                    "argocd login $ARGOCD_SERVER --username $ARGOCD_USERNAME --password $ARGOCD_PASSWORD --insecure",
-                    "argocd app sync my-application",
-                    "argocd app wait my-application --health"
-                ]),
-                "env": {
-                    "ARGOCD_SERVER": "${{ secrets.ARGOCD_SERVER }}",
-                    "ARGOCD_USERNAME": "${{ secrets.ARGOCD_USERNAME }}",
-                    "ARGOCD_PASSWORD": "${{ secrets.ARGOCD_PASSWORD }}"
-                }
-            })
-        elif args.k8s_method == "flux":
-            workflow["jobs"]["deploy"]["steps"].append({
-                "name": "Deploy with Flux",
-                "if": "github.ref == 'refs/heads/main'",
-                "run": "\n".join([
-                    "flux reconcile source git flux-system",
-                    "flux reconcile kustomization flux-system"
-                ])
-            })
-    
-    return workflow
+    }
+
+def generate_complete_workflow(args, values, configs):
+    """Generate a complete CI/CD workflow."""
+    return {
+        "name": f"{args.name} CI/CD",
+        "on": _triggers(_branch_list(args), environment_input=True,
+                        paths_ignore=values.get("paths_ignore", PATHS_IGNORE)),
+        "concurrency": _deploy_concurrency(),
+        "jobs": {
+            "build": _compose_job("build", args, values, configs, matrix=args.matrix),
+            "test": _compose_job("test", args, values, configs, needs=["build"], matrix=args.matrix),
+            "deploy": _compose_job("deploy", args, values, configs, needs=["test"],
+                                   condition="github.ref == 'refs/heads/main'", matrix=args.matrix)
+        }
+    }
+
+# Reusable-workflow deploy step exposing the workflow_call inputs as outputs
+def _reusable_config_step():
+    return {
+        "name": "Parse input configurations",
+        "id": "config",
+        "run": (
+            "echo \"languages=${{ inputs.languages }}\" >> $GITHUB_OUTPUT\n"
+            "echo \"k8s_deploy=${{ inputs.kubernetes_deploy }}\" >> $GITHUB_OUTPUT\n"
+            "echo \"k8s_method=${{ inputs.k8s_method }}\" >> $GITHUB_OUTPUT\n"
+            "echo \"env=${{ inputs.environment }}\" >> $GITHUB_OUTPUT"
+        )
+    }
+
+# Gate for the reusable workflow's Kubernetes steps
+REUSABLE_K8S_CONDITION = "github.ref == 'refs/heads/main' && steps.config.outputs.k8s_deploy == 'true'"
+
+def _reusable_k8s_condition(method):
+    """Return the ``if:`` that runs a reusable-workflow step only for *method*."""
+    return f"{REUSABLE_K8S_CONDITION} && steps.config.outputs.k8s_method == '{method}'"
+
+# One step per k8s_method input, so GitHub skips the unused methods without
+# starting a shell
+def _reusable_k8s_deploy_steps():
+    return {
+        "kubectl": {
+            "name": "Deploy to Kubernetes",
+            "if": _reusable_k8s_condition("kubectl"),
+            "run": (
+                "kubectl apply -f ./k8s/deployment.yaml -f ./k8s/service.yaml\n"
+                "kubectl rollout status deployment/my-app"
+            )
+        },
+        "kustomize": {
+            "name": "Deploy to Kubernetes with Kustomize",
+            "if": _reusable_k8s_condition("kustomize"),
+            "run": (
+                "kubectl apply -k ./k8s/overlays/${{ steps.config.outputs.env }}\n"
+                "kubectl rollout status deployment/my-app"
+            )
+        },
+        "argocd": {
+            "name": "Deploy with ArgoCD",
+            "if": _reusable_k8s_condition("argocd"),
+            "run": (
+                "argocd login $ARGOCD_SERVER --username $ARGOCD_USERNAME --password $ARGOCD_PASSWORD --insecure\n"
+                "argocd app sync $ARGOCD_APPS --async\n"
+                "argocd app wait $ARGOCD_APPS --health"
+            )
+        },
+        "flux": {
+            "name": "Deploy with Flux",
+            "if": _reusable_k8s_condition("flux"),
+            "run": (
+                "flux reconcile source git flux-system\n"
+                "flux reconcile kustomization flux-system"
+            )
+        },
+    }
 
 def generate_reusable_workflow(args, values, configs):
     """Generate a reusable workflow that can be called from other workflows."""
-    image = values.get('container_image', args.image)
+    image = _container_image(args, values)
+    enabled_languages = _enabled_languages(configs)
+    lint_steps = _analysis_steps(configs, enabled_languages)
+
+    # Build, test and lint share no artifacts here, so they start together and
+    # only deploy waits for all of them
+    jobs = {
+        "build": _job_skeleton("build", image, matrix=args.matrix),
+        "test": _job_skeleton("test", image, matrix=args.matrix),
+    }
+    if lint_steps:
+        jobs["lint"] = _job_skeleton("lint", image)
+        jobs["lint"]["steps"].extend(lint_steps)
+    jobs["deploy"] = _job_skeleton("deploy", image, needs=list(jobs),
+                                   condition="github.ref == 'refs/heads/main'",
+                                   matrix=args.matrix)
+    _add_dependency_caches(jobs["build"], enabled_languages)
+    _add_dependency_caches(jobs["test"], enabled_languages)
     
     workflow = {
         "name": f"{args.name} Reusable Workflow",
@@ -887,7 +955,7 @@ def generate_reusable_workflow(args, values, configs):
                     "languages": {
                         "description": "JSON string of languages to enable",
                         "required": False,
-                        "default": json.dumps(configs["languages"]),
+                        "default": json.dumps(configs["languages"], separators=(",", ":")),
                         "type": "string"
                     },
                     "kubernetes_deploy": {
@@ -915,138 +983,39 @@ def generate_reusable_workflow(args, values, configs):
                 }
             }
         },
-        "jobs": {
-            "build": {
-                "runs-on": "ubuntu-latest",
-                "container": {
-                    "image": image,
-                    "options": "--user root"
-                },
-                "steps": [
-                    {
-                        "name": "Checkout code",
-                        "uses": "actions/checkout@v3"
-                    },
-                    {
-                        "name": "Set up build environment",
-                        "run": "echo 'Setting up build environment for DevOps-OS'"
-                    }
-                ]
-            },
-            "test": {
-                "needs": ["build"],
-                "runs-on": "ubuntu-latest",
-                "container": {
-                    "image": image,
-                    "options": "--user root"
-                },
-                "steps": [
-                    {
-                        "name": "Checkout code",
-                        "uses": "actions/checkout@v3"
-                    },
-                    {
-                        "name": "Set up test environment",
-                        "run": "echo 'Setting up test environment for DevOps-OS'"
-                    }
-                ]
-            },
-            "deploy": {
-                "needs": ["test"],
-                "if": "github.ref == 'refs/heads/main'",
-                "runs-on": "ubuntu-latest",
-                "container": {
-                    "image": image,
-                    "options": "--user root"
-                },
-                "steps": [
-                    {
-                        "name": "Checkout code",
-                        "uses": "actions/checkout@v3"
-                    },
-                    {
-                        "name": "Set up deployment environment",
-                        "run": "echo 'Setting up deployment environment for DevOps-OS'"
-                    },
-                    {
-                        "name": "Parse input configurations",
-                        "id": "config",
-                        "run": "\n".join([
-                            "echo \"languages=${{ inputs.languages }}\" >> $GITHUB_OUTPUT",
-                            "echo \"k8s_deploy=${{ inputs.kubernetes_deploy }}\" >> $GITHUB_OUTPUT",
-                            "echo \"k8s_method=${{ inputs.k8s_method }}\" >> $GITHUB_OUTPUT",
-                            "echo \"env=${{ inputs.environment }}\" >> $GITHUB_OUTPUT"
-                        ])
-                    },
-                    {
-                        "name": "Build and Push Docker Image",
-                        "if": "github.ref == 'refs/heads/main'",
-                        "run": "\n".join([
-                            "echo \"${{ secrets.registry_token }}\" | docker login " + args.registry + " -u ${{ github.actor }} --password-stdin",
-                            "docker build -t " + args.registry + "/${{ github.repository_owner }}/${{ github.event.repository.name }}:latest .",
-                            "docker push " + args.registry + "/${{ github.repository_owner }}/${{ github.event.repository.name }}:latest"
-                        ])
-                    }
-                ]
-            }
-        }
+        "jobs": jobs
     }
-    
-    # Add matrix strategy if enabled
-    if args.matrix:
-        for job in ["build", "test", "deploy"]:
-            workflow["jobs"][job]["strategy"] = {
-                "matrix": {
-                    "os": ["ubuntu-latest"],
-                    "arch": ["amd64", "arm64"]
-                },
-                "fail-fast": False
-            }
-            workflow["jobs"][job]["runs-on"] = "${{ matrix.os }}"
-    
-    # Add conditional Kubernetes deployment steps
-    workflow["jobs"]["deploy"]["steps"].append({
-        "name": "Deploy to Kubernetes",
-        "if": "github.ref == 'refs/heads/main' && steps.config.outputs.k8s_deploy == 'true'",
-        "run": "\n".join([
-            "mkdir -p $HOME/.kube",
-            "echo \"${{ secrets.kubeconfig }}\" > $HOME/.kube/config",
-            "chmod 600 $HOME/.kube/config",
-            "if [[ \"${{ steps.config.outputs.k8s_method }}\" == \"kubectl\" ]]; then",
-            "  kubectl apply -f ./k8s/deployment.yaml",
-            "  kubectl apply -f ./k8s/service.yaml",
-            "  kubectl rollout status deployment/my-app",
-            "elif [[ \"${{ steps.config.outputs.k8s_method }}\" == \"kustomize\" ]]; then",
-            "  kubectl apply -k ./k8s/overlays/${{ steps.config.outputs.env }}",
-            "  kubectl rollout status deployment/my-app",
-            "elif [[ \"${{ steps.config.outputs.k8s_method }}\" == \"argocd\" ]]; then",
-            "  argocd login $ARGOCD_SERVER --username $ARGOCD_USERNAME --password $ARGOCD_PASSWORD --insecure",
-            "  argocd app sync my-application",
-            "  argocd app wait my-application --health",
-            "elif [[ \"${{ steps.config.outputs.k8s_method }}\" == \"flux\" ]]; then",
-            "  flux reconcile source git flux-system",
-            "  flux reconcile kustomization flux-system",
-            "fi"
-        ])
-    })
+
+    jobs["deploy"]["steps"].extend([
+        _reusable_config_step(),
+        *_docker_build_push_steps(args.registry, "registry_token"),
+        _kubeconfig_step("kubeconfig", REUSABLE_K8S_CONDITION),
+        *(_with_argocd_apps(step, values) if method == "argocd" else step
+          for method, step in _reusable_k8s_deploy_steps().items())
+    ])
+    for job in jobs.values():
+        _drop_unused_container(job)
     
     return workflow
 
+# Workflow generator for each --type
+WORKFLOW_GENERATORS = {
+    "build": generate_build_workflow,
+    "test": generate_test_workflow,
+    "deploy": generate_deploy_workflow,
+    "complete": generate_complete_workflow,
+    "reusable": generate_reusable_workflow,
+}
+
 def generate_workflow(args, values, configs):
     """Generate the requested workflow type."""
-    if args.type == "build":
-        return generate_build_workflow(args, values, configs)
-    elif args.type == "test":
-        return generate_test_workflow(args, values, configs)
-    elif args.type == "deploy":
-        return generate_deploy_workflow(args, values, configs)
-    elif args.type == "complete":
-        return generate_complete_workflow(args, values, configs)
-    elif args.type == "reusable" or args.reusable:
-        return generate_reusable_workflow(args, values, configs)
-    else:
+    generator = WORKFLOW_GENERATORS.get(args.type)
+    if generator is None and args.reusable:
+        generator = generate_reusable_workflow
+    if generator is None:
         print(f"Error: Unknown workflow type '{args.type}'")
         sys.exit(1)
+    return generator(args, values, configs)
 
 def main():
     """Main function."""
@@ -1056,14 +1025,7 @@ def main():
     env_config = load_env_config(args.env_file)
     
     # Generate configuration objects
-    configs = {
-        "languages": generate_language_config(args.languages, env_config),
-        "kubernetes": generate_kubernetes_config(args.kubernetes, args.k8s_method, env_config),
-        "cicd": generate_cicd_config(env_config),
-        "build_tools": generate_build_tools_config(env_config),
-        "code_analysis": generate_code_analysis_config(env_config),
-        "devops_tools": generate_devops_tools_config(env_config)
-    }
+    configs = build_configs(args, env_config)
     
     # Generate workflow filename
     filename = f"{args.name.lower().replace(' ', '-')}-{args.type}.yml"
@@ -1072,12 +1034,17 @@ def main():
     # Generate workflow content
     workflow_content = generate_workflow(args, custom_values, configs)
     
-    # Convert workflow to YAML (use _NoAliasDumper to avoid anchor/alias output)
-    yaml_content = yaml.dump(workflow_content, sort_keys=False, Dumper=_NoAliasDumper)
-    
-    # Write to file
-    with open(filepath, 'w') as f:
-        f.write(yaml_content)
+    # Stream the YAML through a large buffer into a sibling temp file, then
+    # rename it into place so readers never see a half-written workflow
+    tmp_path = filepath + ".tmp"
+    try:
+        with open(tmp_path, 'w', buffering=1 << 16) as f:
+            dump_workflow(workflow_content, f)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
     
     print(f"GitHub Actions workflow generated: {filepath}")
     print(f"Type: {args.type}")
@@ -21,6 +21,13 @@ import json
 import yaml
 from pathlib import Path
 
+try:
+    # libyaml-backed emitter; fall back to the pure-Python one when PyYAML
+    # was built without the C extension.
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeDumper as _SafeDumper
+
 # Environment variable prefix
 ENV_PREFIX = "DEVOPS_OS_GITLAB_"
 
@@ -73,7 +80,7 @@ def load_custom_values(file_path):
 
 
 def generate_language_config(languages_str):
-    languages = [l.strip() for l in languages_str.split(",")]
+    languages = frozenset(l.strip().lower() for l in languages_str.split(","))
     return {
         "python": "python" in languages,
         "java": "java" in languages,
@@ -331,7 +338,7 @@ def main():
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     with open(output_path, "w") as fh:
-        yaml.dump(pipeline, fh, sort_keys=False, default_flow_style=False)
+        yaml.dump(pipeline, fh, sort_keys=False, default_flow_style=False, Dumper=_SafeDumper)
 
     print(f"GitLab CI pipeline generated: {output_path}")
     print(f"Type: {args.type}")
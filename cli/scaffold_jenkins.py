@@ -18,9 +18,17 @@ Features:
 import os
 import sys
 import argparse
+import functools
 import json
-from string import Template
+import re
 from pathlib import Path
+from stat import S_ISREG
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
 
 # Default paths
 TEMPLATE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -33,47 +41,79 @@ PIPELINE_TYPES = ["build", "test", "deploy", "complete", "parameterized"]
 # Environment variable prefixes
 ENV_PREFIX = "DEVOPS_OS_JENKINS_"
 
-def parse_arguments():
-    """Parse command line arguments with environment variable fallbacks."""
+# Whole-line // comments allowed in devcontainer.env.json
+_LINE_COMMENT_RE = re.compile(r"^[ \t]*//.*$", re.MULTILINE)
+
+# Environment-variable fallbacks for each option: dest -> (suffix after ENV_PREFIX, default)
+ENV_DEFAULTS = {
+    "name": ("NAME", "DevOps-OS"),
+    "type": ("TYPE", "complete"),
+    "languages": ("LANGUAGES", "python,javascript"),
+    "kubernetes": ("KUBERNETES", "false"),
+    "registry": ("REGISTRY", "docker.io"),
+    "k8s_method": ("K8S_METHOD", "kubectl"),
+    "output": ("OUTPUT", os.path.join(OUTPUT_DIR, "Jenkinsfile")),
+    "custom_values": ("CUSTOM_VALUES", None),
+    "image": ("IMAGE", "docker.io/yourorg/devops-os:latest"),
+    "scm": ("SCM", "git"),
+    "parameters": ("PARAMETERS", "false"),
+    "env_file": ("ENV_FILE", ENV_CONFIG_PATH),
+}
+
+# Options whose environment value is a "true"/"1"/"yes" switch
+BOOL_OPTIONS = frozenset({"kubernetes", "parameters"})
+
+def _build_parser():
+    """Build the argument parser.
+
+    Every option defaults to ``None`` so that ``parse_arguments`` can tell an
+    omitted option apart from one given on the command line and fill it from
+    the environment at parse time.
+    """
     parser = argparse.ArgumentParser(description="Generate Jenkins pipeline files for DevOps-OS")
     parser.add_argument("--name", 
-                       help="Pipeline name",
-                       default=os.environ.get(f"{ENV_PREFIX}NAME", "DevOps-OS"))
+                       help="Pipeline name")
     parser.add_argument("--type", choices=PIPELINE_TYPES, 
-                       help="Type of pipeline to generate",
-                       default=os.environ.get(f"{ENV_PREFIX}TYPE", "complete"))
+                       help="Type of pipeline to generate")
     parser.add_argument("--languages", 
-                       help="Comma-separated list of languages to enable (python,java,javascript,go)",
-                       default=os.environ.get(f"{ENV_PREFIX}LANGUAGES", "python,javascript"))
-    parser.add_argument("--kubernetes", action="store_true", 
-                       help="Include Kubernetes deployment steps",
-                       default=os.environ.get(f"{ENV_PREFIX}KUBERNETES", "false").lower() in ("true", "1", "yes"))
+                       help="Comma-separated list of languages to enable (python,java,javascript,go)")
+    parser.add_argument("--kubernetes", action="store_true", default=None,
+                       help="Include Kubernetes deployment steps")
     parser.add_argument("--registry", 
-                       help="Container registry URL",
-                       default=os.environ.get(f"{ENV_PREFIX}REGISTRY", "docker.io"))
+                       help="Container registry URL")
     parser.add_argument("--k8s-method", choices=["kubectl", "kustomize", "argocd", "flux"],
-                       help="Kubernetes deployment method",
-                       default=os.environ.get(f"{ENV_PREFIX}K8S_METHOD", "kubectl"))
+                       help="Kubernetes deployment method")
     parser.add_argument("--output", 
-                       help="Output file path for generated Jenkinsfile",
-                       default=os.environ.get(f"{ENV_PREFIX}OUTPUT", os.path.join(OUTPUT_DIR, "Jenkinsfile")))
+                       help="Output file path for generated Jenkinsfile")
     parser.add_argument("--custom-values", 
-                       help="Path to custom values JSON file",
-                       default=os.environ.get(f"{ENV_PREFIX}CUSTOM_VALUES"))
+                       help="Path to custom values JSON file")
     parser.add_argument("--image", 
-                       help="DevOps-OS container image to use",
-                       default=os.environ.get(f"{ENV_PREFIX}IMAGE", "docker.io/yourorg/devops-os:latest"))
+                       help="DevOps-OS container image to use")
     parser.add_argument("--scm", choices=["git", "svn", "none"],
-                       help="Source Control Management system to use",
-                       default=os.environ.get(f"{ENV_PREFIX}SCM", "git"))
-    parser.add_argument("--parameters", action="store_true",
-                       help="Generate pipeline with parameters (for manual runs)",
-                       default=os.environ.get(f"{ENV_PREFIX}PARAMETERS", "false").lower() in ("true", "1", "yes"))
+                       help="Source Control Management system to use")
+    parser.add_argument("--parameters", action="store_true", default=None,
+                       help="Generate pipeline with parameters (for manual runs)")
     parser.add_argument("--env-file", 
-                       help="Use DevOps-OS devcontainer.env.json for configuration",
-                       default=os.environ.get(f"{ENV_PREFIX}ENV_FILE", ENV_CONFIG_PATH))
-    
-    args = parser.parse_args()
+                       help="Use DevOps-OS devcontainer.env.json for configuration")
+    parser.add_argument("--batch", action="store_true",
+                       help="Read a JSON array of option objects from stdin and generate one Jenkinsfile per entry")
+    return parser
+
+_PARSER = _build_parser()
+
+def parse_arguments(argv=None):
+    """Parse command line arguments with environment variable fallbacks."""
+    args = _PARSER.parse_args(argv)
+
+    # Fill omitted options from DEVOPS_OS_JENKINS_* in a single pass over the environment
+    env = {key[len(ENV_PREFIX):]: value for key, value in os.environ.items()
+           if key.startswith(ENV_PREFIX)}
+    for dest, (suffix, default) in ENV_DEFAULTS.items():
+        if getattr(args, dest) is None:
+            value = env.get(suffix, default)
+            if dest in BOOL_OPTIONS:
+                value = value.lower() in ("true", "1", "yes")
+            setattr(args, dest, value)
     
     # If type is 'parameterized', set parameters flag to True
     if args.type == "parameterized":
@@ -81,25 +121,45 @@ def parse_arguments():
     
     return args
 
+def _loads_json(raw):
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+@functools.lru_cache(maxsize=16)
+def _read_json_file(path, mtime_ns, size, strip_comments):  # noqa: ARG001
+    """Parse the JSON file at *path*, memoized on its modification time and size.
+
+    ``mtime_ns`` and ``size`` only key the cache, so an edited file is
+    re-read while repeated generations in one process reuse the parsed
+    object. Callers must treat the result as read-only.
+    """
+    raw = Path(path).read_bytes()
+    if strip_comments:
+        # Remove comments that start with // for JSON parsing
+        raw = _LINE_COMMENT_RE.sub("", raw.decode("utf-8"))
+    return _loads_json(raw)
+
+def _load_json_file(file_path, strip_comments=False):
+    """Return the parsed JSON file at *file_path*, or ``{}`` if it is unset or missing."""
+    if not file_path:
+        return {}
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return {}
+    if not S_ISREG(st.st_mode):
+        return {}
+    return _read_json_file(os.path.abspath(file_path), st.st_mtime_ns, st.st_size, strip_comments)
+
 def load_custom_values(file_path):
     """Load custom values from a JSON file."""
-    if file_path and os.path.exists(file_path):
-        with open(file_path, 'r') as f:
-            return json.load(f)
-    return {}
+    return _load_json_file(file_path)
 
 def load_env_config(file_path):
     """Load DevOps-OS environment configuration."""
-    if file_path and os.path.exists(file_path):
-        with open(file_path, 'r') as f:
-            # Remove comments that start with // for JSON parsing
-            lines = f.readlines()
-            cleaned_json = ""
-            for line in lines:
-                if not line.strip().startswith("//"):
-                    cleaned_json += line
-            return json.loads(cleaned_json)
-    return {}
+    return _load_json_file(file_path, strip_comments=True)
 
 def create_directory_structure(output_path):
     """Create the necessary directory structure."""
@@ -109,7 +169,7 @@ def create_directory_structure(output_path):
 
 def generate_language_config(languages_str, env_config=None):
     """Generate language configuration JSON."""
-    languages = languages_str.split(',')
+    languages = frozenset(lang.strip().lower() for lang in languages_str.split(','))
     
     # Default to env_config if available, otherwise use languages from args
     if env_config and 'languages' in env_config:
@@ -143,78 +203,92 @@ def generate_kubernetes_config(k8s_enabled, k8s_method, env_config=None):
     }
     return config
 
+# Read-only defaults used when the env config does not override a section
+DEFAULT_CICD_CONFIG = MappingProxyType({
+    "docker": True,
+    "terraform": True,
+    "kubectl": True,
+    "helm": True,
+    "github_actions": True
+})
+
+DEFAULT_BUILD_TOOLS_CONFIG = MappingProxyType({
+    "gradle": True,
+    "maven": True,
+    "ant": False,
+    "make": True,
+    "cmake": False
+})
+
+DEFAULT_CODE_ANALYSIS_CONFIG = MappingProxyType({
+    "sonarqube": True,
+    "checkstyle": True,
+    "pmd": False,
+    "eslint": True,
+    "pylint": True
+})
+
+DEFAULT_DEVOPS_TOOLS_CONFIG = MappingProxyType({
+    "nexus": False,
+    "prometheus": True,
+    "grafana": True,
+    "elk": True,
+    "jenkins": True
+})
+
 def generate_cicd_config(env_config=None):
     """Generate CI/CD tools configuration JSON."""
     if env_config and 'cicd' in env_config:
         return env_config['cicd']
     
-    return {
-        "docker": True,
-        "terraform": True,
-        "kubectl": True,
-        "helm": True,
-        "github_actions": True
-    }
+    return DEFAULT_CICD_CONFIG
 
 def generate_build_tools_config(env_config=None):
     """Generate build tools configuration JSON."""
     if env_config and 'build_tools' in env_config:
         return env_config['build_tools']
     
-    return {
-        "gradle": True,
-        "maven": True,
-        "ant": False,
-        "make": True,
-        "cmake": False
-    }
+    return DEFAULT_BUILD_TOOLS_CONFIG
 
 def generate_code_analysis_config(env_config=None):
     """Generate code analysis tools configuration JSON."""
     if env_config and 'code_analysis' in env_config:
         return env_config['code_analysis']
     
-    return {
-        "sonarqube": True,
-        "checkstyle": True,
-        "pmd": False,
-        "eslint": True,
-        "pylint": True
-    }
+    return DEFAULT_CODE_ANALYSIS_CONFIG
 
 def generate_devops_tools_config(env_config=None):
     """Generate DevOps tools configuration JSON."""
     if env_config and 'devops_tools' in env_config:
         return env_config['devops_tools']
     
-    return {
-        "nexus": False,
-        "prometheus": True,
-        "grafana": True,
-        "elk": True,
-        "jenkins": True
-    }
+    return DEFAULT_DEVOPS_TOOLS_CONFIG
 
 def generate_parameters_block(args, configs):
     """Generate pipeline parameters block."""
     if not args.parameters:
         return ""
-    
+    return _parameters_block(tuple(configs["languages"].items()),
+                             args.kubernetes, args.k8s_method, args.registry)
+
+@functools.lru_cache(maxsize=32)
+def _parameters_block(languages, kubernetes, k8s_method, registry):
+    """Render the parameters block; the result depends only on the arguments."""
     parameters = []
     
     # Add language parameters
-    for lang, enabled in configs["languages"].items():
+    for lang, enabled in languages:
         param_name = f"{lang.upper()}_ENABLED"
         parameters.append(f"        booleanParam(name: '{param_name}', defaultValue: {str(enabled).lower()}, description: 'Enable {lang.capitalize()} tools')")
     
     # Add Kubernetes parameters if enabled
-    if args.kubernetes:
+    if kubernetes:
         parameters.append(f"        booleanParam(name: 'KUBERNETES_DEPLOY', defaultValue: true, description: 'Deploy to Kubernetes')")
-        parameters.append(f"        choice(name: 'K8S_METHOD', choices: ['kubectl', 'kustomize', 'argocd', 'flux'], defaultValue: '{args.k8s_method}', description: 'Kubernetes deployment method')")
+        parameters.append(f"        choice(name: 'K8S_METHOD', choices: ['kubectl', 'kustomize', 'argocd', 'flux'], defaultValue: '{k8s_method}', description: 'Kubernetes deployment method')")
         parameters.append(f"        choice(name: 'ENVIRONMENT', choices: ['dev', 'test', 'staging', 'prod'], defaultValue: 'dev', description: 'Deployment environment')")
     
     # Add registry parameter
-    parameters.append(f"        string(name: 'REGISTRY_URL', defaultValue: '{args.registry}', description: 'Container registry URL')")
+    parameters.append(f"        string(name: 'REGISTRY_URL', defaultValue: '{registry}', description: 'Container registry URL')")
     parameters.append(f"        string(name: 'IMAGE_NAME', defaultValue: 'devops-os-app', description: 'Name of the container image')")
     parameters.append(f"        string(name: 'IMAGE_TAG', defaultValue: 'latest', description: 'Container image tag')")
     
@@ -224,37 +298,39 @@ def generate_parameters_block(args, configs):
 
 def generate_environment_block(args, configs):
     """Generate pipeline environment block."""
+    return _environment_block(tuple(configs["languages"].items()),
+                              args.kubernetes, args.k8s_method, args.registry)
+
+@functools.lru_cache(maxsize=32)
+def _environment_block(languages, kubernetes, k8s_method, registry):
+    """Render the environment block; the result depends only on the arguments."""
     env_vars = []
     
     # Add default environment variables
     env_vars.append("        WORKSPACE_DIR = '${WORKSPACE}'")
-    env_vars.append(f"        REGISTRY_URL = params.REGISTRY_URL ?: '{args.registry}'")
+    env_vars.append(f"        REGISTRY_URL = params.REGISTRY_URL ?: '{registry}'")
     env_vars.append("        IMAGE_NAME = params.IMAGE_NAME ?: 'devops-os-app'")
     env_vars.append("        IMAGE_TAG = params.IMAGE_TAG ?: 'latest'")
     
-    if args.kubernetes:
+    if kubernetes:
         env_vars.append("        KUBERNETES_DEPLOY = params.KUBERNETES_DEPLOY ?: true")
-        env_vars.append(f"        K8S_METHOD = params.K8S_METHOD ?: '{args.k8s_method}'")
+        env_vars.append(f"        K8S_METHOD = params.K8S_METHOD ?: '{k8s_method}'")
         env_vars.append("        ENVIRONMENT = params.ENVIRONMENT ?: 'dev'")
     
     # Add language environment variables
-    for lang, enabled in configs["languages"].items():
+    for lang, enabled in languages:
         env_vars.append(f"        {lang.upper()}_ENABLED = params.{lang.upper()}_ENABLED ?: {str(enabled).lower()}")
     
     if env_vars:
         return "    environment {\n" + "\n".join(env_vars) + "\n    }"
     return ""
 
-def generate_build_stage(configs):
-    """Generate pipeline build stage."""
-    build_steps = []
-    
-    # Add checkout step
-    build_steps.append("                checkout scm")
-    
-    # Add language-specific build steps
-    if configs["languages"].get("python", False):
-        build_steps.append("""                sh '''
+# Language build and test steps, in emission order. Each entry is
+# (language, code-analysis tool or None, step); a step is emitted when its
+# language is enabled and, for analysis steps, the tool is enabled too.
+STAGE_STEPS = {
+    "build": (
+        ("python", None, """                sh '''
                     if [ ${PYTHON_ENABLED} = 'true' ] && [ -f requirements.txt ]; then
                         pip install -r requirements.txt
                     fi
@@ -263,134 +339,134 @@ def generate_build_stage(configs):
                     elif [ ${PYTHON_ENABLED} = 'true' ] && [ -f pyproject.toml ]; then
                         pip install -e .
                     fi
-                '''""")
-    
-    if configs["languages"].get("java", False):
-        build_steps.append("""                sh '''
+                '''"""),
+        ("java", None, """                sh '''
                     if [ ${JAVA_ENABLED} = 'true' ] && [ -f pom.xml ]; then
                         mvn -B package --file pom.xml
                     fi
                     if [ ${JAVA_ENABLED} = 'true' ] && [ -f build.gradle ]; then
                         ./gradlew build
                     fi
-                '''""")
-    
-    if configs["languages"].get("javascript", False):
-        build_steps.append("""                sh '''
+                '''"""),
+        ("javascript", None, """                sh '''
                     if [ ${JAVASCRIPT_ENABLED} = 'true' ] && [ -f package.json ]; then
                         npm ci
                         npm run build --if-present
                     fi
-                '''""")
-    
-    if configs["languages"].get("go", False):
-        build_steps.append("""                sh '''
+                '''"""),
+        ("go", None, """                sh '''
                     if [ ${GO_ENABLED} = 'true' ] && [ -f go.mod ]; then
                         go build -v ./...
                     fi
-                '''""")
-    
-    # Add artifact archiving step
-    build_steps.append("""                archiveArtifacts artifacts: '**/target/*.jar, **/dist/*, **/build/*, **/*.zip, **/*.tar.gz', allowEmptyArchive: true""")
-    
-    return "        stage('Build') {\n            steps {\n" + "\n".join(build_steps) + "\n            }\n        }"
-
-def generate_test_stage(configs):
-    """Generate pipeline test stage."""
-    test_steps = []
-    
-    # Add language-specific test steps
-    if configs["languages"].get("python", False):
-        test_steps.append("""                sh '''
+                '''"""),
+    ),
+    "test": (
+        ("python", None, """                sh '''
                     if [ ${PYTHON_ENABLED} = 'true' ] && [ -f requirements.txt ]; then
                         pip install -r requirements.txt pytest pytest-cov
                     fi
                     if [ ${PYTHON_ENABLED} = 'true' ] && [ -d tests ]; then
                         python -m pytest --cov=./ --cov-report=xml
                     fi
-                '''""")
-        if configs.get("code_analysis", {}).get("pylint", False):
-            test_steps.append("""                sh '''
+                '''"""),
+        ("python", "pylint", """                sh '''
                     if [ ${PYTHON_ENABLED} = 'true' ] && command -v pylint &> /dev/null; then
                         pylint --disable=C0111 **/*.py || true
                     fi
-                '''""")
-    
-    if configs["languages"].get("java", False):
-        test_steps.append("""                sh '''
+                '''"""),
+        ("java", None, """                sh '''
                     if [ ${JAVA_ENABLED} = 'true' ] && [ -f pom.xml ]; then
                         mvn -B test --file pom.xml
                     fi
                     if [ ${JAVA_ENABLED} = 'true' ] && [ -f build.gradle ]; then
                         ./gradlew test
                     fi
-                '''""")
-        if configs.get("code_analysis", {}).get("checkstyle", False):
-            test_steps.append("""                sh '''
+                '''"""),
+        ("java", "checkstyle", """                sh '''
                     if [ ${JAVA_ENABLED} = 'true' ] && [ -f pom.xml ]; then
                         mvn checkstyle:checkstyle || true
                     fi
-                '''""")
-    
-    if configs["languages"].get("javascript", False):
-        test_steps.append("""                sh '''
+                '''"""),
+        ("javascript", None, """                sh '''
                     if [ ${JAVASCRIPT_ENABLED} = 'true' ] && [ -f package.json ]; then
                         npm test || true
                     fi
-                '''""")
-        if configs.get("code_analysis", {}).get("eslint", False):
-            test_steps.append("""                sh '''
+                '''"""),
+        ("javascript", "eslint", """                sh '''
                     if [ ${JAVASCRIPT_ENABLED} = 'true' ] && [ -f package.json ] && grep -q eslint package.json; then
                         npm run lint || true
                     fi
-                '''""")
-    
-    if configs["languages"].get("go", False):
-        test_steps.append("""                sh '''
+                '''"""),
+        ("go", None, """                sh '''
                     if [ ${GO_ENABLED} = 'true' ] && [ -f go.mod ]; then
                         go test -v ./...
                     fi
-                '''""")
-    
-    # Add test results collection step
-    test_steps.append("""                junit '**/target/surefire-reports/*.xml, **/test-results/*.xml, **/junit-reports/*.xml', allowEmptyResults: true""")
-    
-    return "        stage('Test') {\n            steps {\n" + "\n".join(test_steps) + "\n            }\n        }"
+                '''"""),
+    ),
+}
 
-def generate_deploy_stage(args, configs):
-    """Generate pipeline deploy stage."""
-    deploy_steps = []
-    
-    # Add Docker build and push steps
-    deploy_steps.append("""                script {
+CHECKOUT_STEP = "                checkout scm"
+ARCHIVE_STEP = """                archiveArtifacts artifacts: '**/target/*.jar, **/dist/*, **/build/*, **/*.zip, **/*.tar.gz', allowEmptyArchive: true"""
+JUNIT_STEP = """                junit '**/target/surefire-reports/*.xml, **/test-results/*.xml, **/junit-reports/*.xml', allowEmptyResults: true"""
+
+def _stage_steps(stage, configs):
+    """Return the language and code-analysis steps enabled for *stage*."""
+    languages = configs["languages"]
+    analysis = configs.get("code_analysis", {})
+    return [
+        step for language, tool, step in STAGE_STEPS[stage]
+        if languages.get(language, False)
+        and (tool is None or analysis.get(tool, False))
+    ]
+
+def generate_build_stage(args, configs):
+    """Generate pipeline build stage."""
+    return "\n".join([
+        "        stage('Build') {",
+        "            steps {",
+        CHECKOUT_STEP,
+        *_stage_steps("build", configs),
+        ARCHIVE_STEP,
+        "            }",
+        "        }",
+    ])
+
+def generate_test_stage(args, configs):
+    """Generate pipeline test stage."""
+    return "\n".join([
+        "        stage('Test') {",
+        "            steps {",
+        *_stage_steps("test", configs),
+        JUNIT_STEP,
+        "            }",
+        "        }",
+    ])
+
+DOCKER_PUSH_STEP = """                script {
                     def imageName = "${REGISTRY_URL}/${IMAGE_NAME}:${IMAGE_TAG}"
                     docker.withRegistry('https://' + REGISTRY_URL, 'registry-credentials') {
                         def customImage = docker.build(imageName)
                         customImage.push()
                     }
-                }""")
-    
-    # Add Kubernetes deployment steps if enabled
-    if args.kubernetes:
-        deploy_steps.append("""                script {
-                    if (env.KUBERNETES_DEPLOY == 'true') {
-                        // Set up Kubernetes credentials
-                        withCredentials([file(credentialsId: 'kubeconfig', variable: 'KUBECONFIG')]) {
-                            sh 'mkdir -p ~/.kube && cp $KUBECONFIG ~/.kube/config && chmod 600 ~/.kube/config'
-                            
-                            if (env.K8S_METHOD == 'kubectl') {
-                                sh '''
+                }"""
+
+DEPLOY_NOTIFY_STEP = """                sh '''
+                    echo "Deployment completed successfully"
+                '''"""
+
+# Kubernetes deployment commands per method. Every method is emitted so
+# the K8S_METHOD parameter can still choose one at run time.
+K8S_DEPLOY_COMMANDS = {
+    "kubectl": """                                sh '''
                                     kubectl apply -f ./k8s/deployment.yaml
                                     kubectl apply -f ./k8s/service.yaml
                                     kubectl rollout status deployment/my-app
-                                '''
-                            } else if (env.K8S_METHOD == 'kustomize') {
-                                sh '''
+                                '''""",
+    "kustomize": """                                sh '''
                                     kubectl apply -k ./k8s/overlays/${ENVIRONMENT}
                                     kubectl rollout status deployment/my-app
-                                '''
-                            } else if (env.K8S_METHOD == 'argocd') {
-                                withCredentials([
+                                '''""",
+    "argocd": """                                withCredentials([
                                     string(credentialsId: 'argocd-server', variable: 'ARGOCD_SERVER'),
                                     usernamePassword(credentialsId: 'argocd-credentials', usernameVariable: 'ARGOCD_USERNAME', passwordVariable: 'ARGOCD_PASSWORD')
                                 ]) {
@@ -399,35 +475,36 @@ def generate_deploy_stage(args, configs):
                                         argocd app sync my-application
                                         argocd app wait my-application --health
                                     '''
-                                }
-                            } else if (env.K8S_METHOD == 'flux') {
-                                sh '''
+                                }""",
+    "flux": """                                sh '''
                                     flux reconcile source git flux-system
                                     flux reconcile kustomization flux-system
-                                '''
-                            }
+                                '''""",
+}
+
+K8S_DEPLOY_STEP = """                script {
+                    if (env.KUBERNETES_DEPLOY == 'true') {
+                        // Set up Kubernetes credentials
+                        withCredentials([file(credentialsId: 'kubeconfig', variable: 'KUBECONFIG')]) {
+                            sh 'mkdir -p ~/.kube && cp $KUBECONFIG ~/.kube/config && chmod 600 ~/.kube/config'
+                            
+                            %s
                         }
                     }
-                }""")
-    
-    # Add deployment notification step
-    deploy_steps.append("""                sh '''
-                    echo "Deployment completed successfully"
-                '''""")
-    
-    deploy_stage = "        stage('Deploy') {\n"
-    
-    # Add deployment approval for production
-    deploy_stage += """            when {
+                }""" % " else ".join(
+    f"if (env.K8S_METHOD == '{method}') {{\n{commands}\n                            }}"
+    for method, commands in K8S_DEPLOY_COMMANDS.items()
+)
+
+# Deployment approval for production
+DEPLOY_WHEN_BLOCK = """            when {
                 expression { 
                     return env.ENVIRONMENT != 'prod' || (env.ENVIRONMENT == 'prod' && currentBuild.resultIsBetterOrEqualTo('SUCCESS'))
                 }
-            }
-"""
-    
-    # Add inputs for production deployment
-    if args.kubernetes:
-        deploy_stage += """            input {
+            }"""
+
+# Confirmation input for production Kubernetes deployments
+DEPLOY_INPUT_BLOCK = """            input {
                 message "Deploy to production?"
                 ok "Yes"
                 submitter "admin"
@@ -437,16 +514,63 @@ def generate_deploy_stage(args, configs):
                 when {
                     expression { return env.ENVIRONMENT == 'prod' }
                 }
-            }
-"""
+            }"""
+
+def generate_deploy_stage(args, configs):
+    """Generate pipeline deploy stage."""
+    deploy_stage = ["        stage('Deploy') {", DEPLOY_WHEN_BLOCK]
     
-    deploy_stage += "            steps {\n" + "\n".join(deploy_steps) + "\n            }\n        }"
+    # Add inputs for production deployment
+    if args.kubernetes:
+        deploy_stage.append(DEPLOY_INPUT_BLOCK)
+    
+    # Docker build and push, optional Kubernetes rollout, then notification
+    deploy_stage.append("            steps {")
+    deploy_stage.append(DOCKER_PUSH_STEP)
+    if args.kubernetes:
+        deploy_stage.append(K8S_DEPLOY_STEP)
+    deploy_stage.extend([DEPLOY_NOTIFY_STEP, "            }", "        }"])
     
-    return deploy_stage
+    return "\n".join(deploy_stage)
 
-def generate_pipeline(args, configs):
-    """Generate Jenkins pipeline."""
-    pipeline = [
+OPTIONS_BLOCK = """    options {
+        timestamps()
+        timeout(time: 60, unit: 'MINUTES')
+        buildDiscarder(logRotator(numToKeepStr: '10'))
+        disableConcurrentBuilds()
+        ansiColor('xterm')
+    }"""
+
+POST_BLOCK = """    post {
+        always {
+            cleanWs()
+        }
+        success {
+            echo 'Pipeline completed successfully!'
+        }
+        failure {
+            echo 'Pipeline failed!'
+        }
+    }"""
+
+STAGE_GENERATORS = {
+    "build": generate_build_stage,
+    "test": generate_test_stage,
+    "deploy": generate_deploy_stage,
+}
+
+# Stages emitted by each pipeline type, in order
+PIPELINE_STAGES = {
+    "build": ("build",),
+    "test": ("test",),
+    "deploy": ("deploy",),
+    "complete": ("build", "test", "deploy"),
+    "parameterized": ("build", "test", "deploy"),
+}
+
+def iter_pipeline(args, configs):
+    """Yield the Jenkins pipeline in blocks; joined with ``""`` they form the whole file."""
+    yield "\n".join([
         "pipeline {",
         "    agent {",
         "        docker {",
@@ -454,64 +578,81 @@ def generate_pipeline(args, configs):
         "            args '-v /var/run/docker.sock:/var/run/docker.sock -u root'",
         "        }",
         "    }"
-    ]
+    ])
     
     # Add parameters block if enabled
     params_block = generate_parameters_block(args, configs)
     if params_block:
-        pipeline.append(params_block)
+        yield "\n" + params_block
     
     # Add environment block
     env_block = generate_environment_block(args, configs)
     if env_block:
-        pipeline.append(env_block)
+        yield "\n" + env_block
     
     # Add options block
-    pipeline.append("""    options {
-        timestamps()
-        timeout(time: 60, unit: 'MINUTES')
-        buildDiscarder(logRotator(numToKeepStr: '10'))
-        disableConcurrentBuilds()
-        ansiColor('xterm')
-    }""")
+    yield "\n" + OPTIONS_BLOCK
     
     # Add stages
-    pipeline.append("    stages {")
-    
-    # Add build stage if requested
-    if args.type in ["build", "complete", "parameterized"]:
-        pipeline.append(generate_build_stage(configs))
-    
-    # Add test stage if requested
-    if args.type in ["test", "complete", "parameterized"]:
-        pipeline.append(generate_test_stage(configs))
+    yield "\n    stages {"
+    for stage in PIPELINE_STAGES.get(args.type, ()):
+        yield "\n" + STAGE_GENERATORS[stage](args, configs)
     
-    # Add deploy stage if requested
-    if args.type in ["deploy", "complete", "parameterized"]:
-        pipeline.append(generate_deploy_stage(args, configs))
-    
-    pipeline.append("    }")
+    yield "\n    }"
     
     # Add post section
-    pipeline.append("""    post {
-        always {
-            cleanWs()
-        }
-        success {
-            echo 'Pipeline completed successfully!'
-        }
-        failure {
-            echo 'Pipeline failed!'
-        }
-    }""")
-    
-    pipeline.append("}")
+    yield "\n" + POST_BLOCK
     
-    return "\n".join(pipeline)
+    yield "\n}"
 
-def main():
-    """Main function."""
-    args = parse_arguments()
+@functools.lru_cache(maxsize=64)
+def _render_pipeline(key):
+    """Render the pipeline blocks for a key built by ``_pipeline_blocks``.
+
+    Only the inputs captured in *key* are rebuilt, so a stage that starts
+    reading anything else fails loudly here instead of serving stale output.
+    """
+    pipeline_type, image, registry, kubernetes, k8s_method, parameters, languages, analysis = key
+    args = argparse.Namespace(type=pipeline_type, image=image, registry=registry,
+                              kubernetes=kubernetes, k8s_method=k8s_method, parameters=parameters)
+    configs = {"languages": dict(languages), "code_analysis": dict(analysis)}
+    return tuple(iter_pipeline(args, configs))
+
+def _pipeline_blocks(args, configs):
+    """Return the pipeline blocks for *args*, reusing an identical earlier render."""
+    return _render_pipeline((
+        args.type, args.image, args.registry, args.kubernetes, args.k8s_method, args.parameters,
+        tuple(configs["languages"].items()), tuple(configs.get("code_analysis", {}).items()),
+    ))
+
+def generate_pipeline(args, configs):
+    """Generate Jenkins pipeline."""
+    return "".join(_pipeline_blocks(args, configs))
+
+def _spec_argv(spec):
+    """Turn one ``--batch`` entry into command-line arguments.
+
+    Keys are option names (``k8s_method`` or ``k8s-method``); ``true``
+    switches a flag on (as do ``"true"``/``"1"``/``"yes"``), ``false``/``null``
+    leave the option at its default and a list is joined with commas
+    (``["python", "go"]`` -> ``python,go``).
+    """
+    argv = []
+    for key, value in spec.items():
+        option = "--" + key.replace("_", "-")
+        if key.replace("-", "_") in BOOL_OPTIONS and isinstance(value, str):
+            # Flags read "true"/"1"/"yes" the same way as their environment fallbacks
+            value = value.lower() in ("true", "1", "yes")
+        if value is True:
+            argv.append(option)
+        elif isinstance(value, list):
+            argv.extend([option, ",".join(str(item) for item in value)])
+        elif value is not False and value is not None:
+            argv.extend([option, str(value)])
+    return argv
+
+def generate_jenkinsfile(args):
+    """Generate and write the Jenkinsfile described by *args*."""
     output_path = create_directory_structure(args.output)
     custom_values = load_custom_values(args.custom_values)
     env_config = load_env_config(args.env_file)
@@ -526,12 +667,10 @@ def main():
         "devops_tools": generate_devops_tools_config(env_config)
     }
     
-    # Generate pipeline content
-    pipeline_content = generate_pipeline(args, configs)
-    
-    # Write to file
-    with open(output_path, 'w') as f:
-        f.write(pipeline_content)
+    # Generate the pipeline straight into the output file; a 64 KiB buffer
+    # holds a whole Jenkinsfile so it goes out in a single write
+    with open(output_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+        f.writelines(_pipeline_blocks(args, configs))
     
     print(f"Jenkins pipeline generated: {output_path}")
     print(f"Type: {args.type}")
@@ -541,5 +680,41 @@ def main():
     if args.parameters:
         print("Pipeline includes runtime parameters")
 
+def main():
+    """Main function."""
+    args = parse_arguments()
+    if not args.batch:
+        generate_jenkinsfile(args)
+        return
+    
+    # One interpreter run for many pipelines: each entry is parsed like a
+    # command line, so defaults, environment fallbacks and choices all apply.
+    try:
+        specs = json.load(sys.stdin)
+    except ValueError as exc:
+        print(f"Error: --batch input is not valid JSON: {exc}")
+        sys.exit(1)
+    if not isinstance(specs, list):
+        print("Error: --batch expects a JSON array of option objects on stdin")
+        sys.exit(1)
+    # Check every entry before writing anything, so a bad entry never leaves
+    # the batch half done
+    for index, spec in enumerate(specs):
+        if not isinstance(spec, dict):
+            print(f"Error: --batch entry {index} must be a JSON object of options")
+            sys.exit(1)
+        for key, value in spec.items():
+            if isinstance(value, dict):
+                print(f"Error: --batch entry {index} option '{key}' must be a string, number, boolean or list")
+                sys.exit(1)
+            if (key.replace("-", "_") in BOOL_OPTIONS
+                    and not isinstance(value, (bool, str)) and value is not None):
+                print(f"Error: --batch entry {index} flag '{key}' must be true or false")
+                sys.exit(1)
+    # argparse rejects bad choices here, still before any file is written
+    all_args = [parse_arguments(_spec_argv(spec)) for spec in specs]
+    for entry_args in all_args:
+        generate_jenkinsfile(entry_args)
+
 if __name__ == "__main__":
     main()
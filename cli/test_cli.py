@@ -16,6 +16,18 @@ def _run_module(module, extra_args=None):
     args = ["-m", module] + (extra_args or [])
     return _run(args)
 
+def _invoke(args):
+    """Run the devopsos Typer app in-process and return the click Result.
+
+    Avoids an interpreter start per test for checks that only need the
+    app's exit code and output; ``returncode`` mirrors the subprocess API.
+    """
+    from typer.testing import CliRunner
+    from cli.devopsos import app
+    result = CliRunner().invoke(app, args, prog_name="devopsos")
+    result.returncode = result.exit_code
+    return result
+
 _ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*[mK]')
 
 def _strip_ansi(s):
@@ -25,7 +37,7 @@ def _strip_ansi(s):
 # -- devopsos CLI ----------------------------------------------------------
 
 def test_help():
-    result = _run(["-m", "cli.devopsos", "--help"])
+    result = _invoke(["--help"])
     assert result.returncode == 0
     out = _strip_ansi(result.stdout)
     assert "DevOps-OS" in out
@@ -36,7 +48,7 @@ def test_help():
 
 def test_no_args_shows_help():
     """Running without arguments should display help output (not an error)."""
-    result = _run(["-m", "cli.devopsos"])
+    result = _invoke([])
     assert result.returncode == 0
     out = _strip_ansi(result.stdout)
     assert "DevOps-OS" in out
@@ -47,12 +59,7 @@ def test_no_args_shows_help():
 
 def test_init_help_shows_dir_option():
     """--dir option must appear in `devopsos init --help`."""
-    result = subprocess.run(
-        [sys.executable, "-m", "cli.devopsos", "init", "--help"],
-        capture_output=True, text=True,
-        cwd=os.path.dirname(os.path.dirname(__file__)),
-        env={**os.environ, "NO_COLOR": "1"},
-    )
+    result = _invoke(["init", "--help"])
     assert result.returncode == 0
     assert "--dir" in _strip_ansi(result.stdout)
 
@@ -225,6 +232,53 @@ def test_init_selections_written_to_config():
         assert cfg["devops_tools"]["prometheus"] is True, "prometheus should be True"
         assert cfg["devops_tools"]["grafana"] is False, "grafana should be False"
 
+def test_init_config_flag_skips_prompts():
+    """--config with --yes regenerates from a saved env file without any InquirerPy prompt."""
+    from unittest.mock import patch
+
+    with tempfile.TemporaryDirectory() as tmp:
+        saved = Path(tmp) / "saved.env.json"
+        saved.write_text(json.dumps({
+            "languages": {"python": True},
+            "cicd": {"docker": True},
+            "kubernetes": {"k9s": True},
+            "versions": {"python": "3.12"},
+        }))
+        with patch("cli.devopsos.inquirer.checkbox") as mock_cb, \
+             patch("cli.devopsos.inquirer.confirm") as mock_confirm:
+            result = _invoke(["init", "--dir", tmp, "--config", str(saved), "--yes"])
+
+        assert result.exit_code == 0, result.output
+        assert not mock_cb.called
+        assert not mock_confirm.called
+        cfg = json.loads((Path(tmp) / ".devcontainer" / "devcontainer.env.json").read_text())
+        assert cfg["languages"]["python"] is True
+        assert cfg["languages"]["java"] is False
+        assert cfg["cicd"]["docker"] is True
+        assert cfg["kubernetes"]["k9s"] is True
+        assert cfg["build_tools"]["gradle"] is False
+        assert cfg["versions"] == {"python": "3.12"}
+
+def test_init_config_flag_rejects_unreadable_file():
+    """A missing --config file is reported as an error instead of a traceback."""
+    with tempfile.TemporaryDirectory() as tmp:
+        result = _invoke(["init", "--dir", tmp, "--config", str(Path(tmp) / "missing.json"), "--yes"])
+        assert result.exit_code == 1
+        assert "cannot read config file" in result.output
+        assert not (Path(tmp) / ".devcontainer").exists()
+
+def test_init_removes_devcontainer_dir_when_writing_fails():
+    """A failed write must not leave an empty .devcontainer that blocks the next init."""
+    from unittest.mock import patch
+
+    with tempfile.TemporaryDirectory() as tmp:
+        saved = Path(tmp) / "saved.env.json"
+        saved.write_text(json.dumps({"languages": {"python": True}}))
+        with patch("cli.devopsos.write_generated_devcontainer", side_effect=OSError("disk full")):
+            result = _invoke(["init", "--dir", tmp, "--config", str(saved), "--yes"])
+        assert result.exit_code != 0
+        assert not (Path(tmp) / ".devcontainer").exists()
+
 def test_scaffold_unknown():
     """Unknown scaffold subcommand produces a clear Typer error (not a Python traceback)."""
     result = _run(["-m", "cli.devopsos", "scaffold", "unknown"])
@@ -806,6 +860,27 @@ def test_scaffold_cicd_jenkins_only():
         )
 
 
+def test_scaffold_cicd_leaves_identical_readme_untouched():
+    """Re-running `scaffold cicd` with the same options does not rewrite CICD-README.md."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cmd = [
+            sys.executable, "-m", "cli.devopsos",
+            "scaffold", "cicd",
+            "--name", "same-readme",
+            "--output-dir", tmp,
+            "--jenkins",
+        ]
+        cwd = os.path.dirname(os.path.dirname(__file__))
+        first = subprocess.run(cmd, capture_output=True, text=True, cwd=cwd)
+        assert first.returncode == 0, first.stderr + first.stdout
+        readme = Path(tmp, "CICD-README.md")
+        os.utime(readme, ns=(0, 0))
+        second = subprocess.run(cmd, capture_output=True, text=True, cwd=cwd)
+        assert second.returncode == 0, second.stderr + second.stdout
+        assert "CI/CD README unchanged" in second.stdout
+        assert readme.stat().st_mtime_ns == 0
+
+
 # ── scaffold unittest (new in v0.4.0) ────────────────────────────────────────
 
 def test_scaffold_unittest_help_shows_native_options():
@@ -1037,6 +1112,21 @@ def test_scaffold_no_opts_shows_help():
         )
 
 
+def test_cli_import_defers_scaffold_modules():
+    """Importing the CLI must not load any scaffold generator until it is invoked."""
+    result = _run(["-c", "import sys, cli.devopsos; "
+                         "print(sorted(m for m in sys.modules if m.startswith('cli.scaffold_')))"])
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_cli_import_defers_inquirerpy():
+    """InquirerPy is only needed by the init wizard, so importing the CLI must not load it."""
+    result = _run(["-c", "import sys, cli.devopsos; print('InquirerPy' in sys.modules)"])
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
+
+
 
 # -- versioning ------------------------------------------------------------
 
@@ -1045,14 +1135,14 @@ def test_scaffold_no_opts_shows_help():
 
 def test_version_flag_short():
     """-V prints 'devopsos version X.Y.Z' and exits 0."""
-    result = _run(["-m", "cli.devopsos", "-V"])
+    result = _invoke(["-V"])
     assert result.returncode == 0
     assert "devopsos version" in result.stdout
 
 
 def test_version_flag_long():
     """--version prints 'devopsos version X.Y.Z' and exits 0."""
-    result = _run(["-m", "cli.devopsos", "--version"])
+    result = _invoke(["--version"])
     assert result.returncode == 0
     assert "devopsos version" in result.stdout
 
@@ -1060,5 +1150,5 @@ def test_version_flag_long():
 def test_version_matches_package():
     """Version reported by --version matches cli.__version__."""
     from cli import __version__
-    result = _run(["-m", "cli.devopsos", "--version"])
+    result = _invoke(["--version"])
     assert __version__ in result.stdout
@@ -11,19 +11,38 @@ import os
 import sys
 import shutil
 import argparse
+import functools
 import json
-from string import Template
+import re
+from pathlib import Path
+from stat import S_ISREG
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
 
 # Default paths
 TEMPLATE_DIR = os.path.dirname(os.path.abspath(__file__))
 TEMPLATE_KUBE_DIR = os.path.join(TEMPLATE_DIR, "kubernetes-templates")
 OUTPUT_DIR = os.path.join(os.getcwd(), "k8s")
 
+# Template sources for each deployment method
+DEPLOYMENT_TEMPLATE = os.path.join(TEMPLATE_KUBE_DIR, "sample-app-deployment.yaml")
+KUSTOMIZE_BASE_TEMPLATE = os.path.join(TEMPLATE_KUBE_DIR, "kustomize", "base", "kustomization.yaml")
+KUSTOMIZE_OVERLAY_TEMPLATE = os.path.join(TEMPLATE_KUBE_DIR, "kustomize", "overlays", "env", "kustomization.yaml")
+ARGOCD_TEMPLATE = os.path.join(TEMPLATE_KUBE_DIR, "argocd", "application.yaml")
+FLUX_TEMPLATE = os.path.join(TEMPLATE_KUBE_DIR, "flux", "deployment.yaml")
+
 # Supported deployment methods
 DEPLOYMENT_METHODS = ["kubectl", "kustomize", "argocd", "flux"]
 
-def parse_arguments():
-    """Parse command line arguments."""
+# string.Template syntax: $$ escapes, ${NAME} and $NAME substitute. Literal
+# braces are matched too so they can be doubled for str.format_map.
+_TEMPLATE_TOKEN_RE = re.compile(r"\$\$|\$\{([_a-zA-Z][_a-zA-Z0-9]*)\}|\$([_a-zA-Z][_a-zA-Z0-9]*)|[{}]")
+
+def _build_parser():
+    """Build the argument parser."""
     parser = argparse.ArgumentParser(description="Generate Kubernetes configuration files")
     parser.add_argument("--app-name", required=True, help="Application name")
     parser.add_argument("--environment", default="dev", choices=["dev", "test", "staging", "prod"], 
@@ -40,15 +59,36 @@ def parse_arguments():
                        help="Output directory for generated files")
     parser.add_argument("--custom-values", 
                        help="Path to custom values JSON file")
-    
-    return parser.parse_args()
+    return parser
+
+_PARSER = _build_parser()
+
+def parse_arguments(argv=None):
+    """Parse command line arguments."""
+    return _PARSER.parse_args(argv)
+
+@functools.lru_cache(maxsize=8)
+def _load_json_cached(path, mtime_ns):  # noqa: ARG001
+    """Parse the JSON file at *path*; ``mtime_ns`` only keys the cache.
+
+    Callers must treat the result as read-only.
+    """
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 def load_custom_values(file_path):
     """Load custom values from a JSON file."""
-    if file_path and os.path.exists(file_path):
-        with open(file_path, 'r') as f:
-            return json.load(f)
-    return {}
+    if not file_path:
+        return {}
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return {}
+    if not S_ISREG(st.st_mode):
+        return {}
+    return _load_json_cached(os.path.abspath(file_path), st.st_mtime_ns)
 
 def create_directory_structure(args, deployment_method):
     """Create the necessary directory structure based on deployment method."""
@@ -67,16 +107,53 @@ def create_directory_structure(args, deployment_method):
     
     return base_output_dir
 
+class _SafeValues(dict):
+    """Mapping for format_map that leaves unknown placeholders in place.
+
+    ``_format_token`` marks bare ``$NAME`` fields with a leading ``$`` so an
+    unknown one is written back exactly as it appeared, like
+    ``Template.safe_substitute``.
+    """
+
+    def __missing__(self, key):
+        if key.startswith("$"):
+            name = key[1:]
+            return self[name] if name in self else key
+        return "${" + key + "}"
+
+def _format_token(match):
+    """Rewrite one string.Template token in str.format syntax."""
+    token = match.group(0)
+    if match.group(1):
+        return "{" + match.group(1) + "}"
+    if match.group(2):
+        return "{$" + match.group(2) + "}"
+    if token == "$$":
+        return "$"
+    return token * 2
+
+def _compile_template(template_content):
+    """Convert string.Template text into an equivalent str.format_map template."""
+    return _TEMPLATE_TOKEN_RE.sub(_format_token, template_content)
+
+@functools.lru_cache(maxsize=32)
+def _read_template(path, mtime_ns):  # noqa: ARG001
+    """Read and compile the template at *path*; ``mtime_ns`` only keys the cache.
+
+    Returns ``(text, is_static)``. A template without any ``$`` is returned
+    verbatim and flagged static so it can be written without formatting.
+    """
+    with open(path, 'r') as f:
+        content = f.read()
+    if '$' not in content:
+        return content, True
+    return _compile_template(content), False
+
 def substitute_variables(template_path, output_path, values):
     """Substitute variables in a template file and write to output."""
-    with open(template_path, 'r') as f:
-        template_content = f.read()
-    
-    template = Template(template_content)
-    result = template.safe_substitute(values)
-    
-    with open(output_path, 'w') as f:
-        f.write(result)
+    template, is_static = _read_template(os.path.abspath(template_path), os.stat(template_path).st_mtime_ns)
+    result = template if is_static else template.format_map(_SafeValues(values))
+    Path(output_path).write_text(result, encoding="utf-8", newline="")
 
 def copy_template_files(args, custom_values):
     """Copy and update template files based on deployment method."""
@@ -94,48 +171,45 @@ def copy_template_files(args, custom_values):
         "FEATURE_FLAGS": "false" if env == "prod" else "true",
         "DB_USER": "dbuser",
         "DB_PASSWORD": "placeholder",  # Should be replaced with actual secrets
-        "DB_HOST": f"db-{env}",
-        "DB_NAME": f"{args.app_name}-{env}",
         "API_KEY": "placeholder"  # Should be replaced with actual secrets
     }
     
     # Update with custom values
     values.update(custom_values)
     
+    # Derived names are only built when custom values do not supply them
+    if "DB_HOST" not in values:
+        values["DB_HOST"] = f"db-{env}"
+    if "DB_NAME" not in values:
+        values["DB_NAME"] = f"{args.app_name}-{env}"
+    
     if method == "kubectl":
         # Simple kubectl deployment
-        template_path = os.path.join(TEMPLATE_KUBE_DIR, "sample-app-deployment.yaml")
         output_path = os.path.join(base_output_dir, "deployment.yaml")
-        substitute_variables(template_path, output_path, values)
+        substitute_variables(DEPLOYMENT_TEMPLATE, output_path, values)
         
     elif method == "kustomize":
         # Kustomize deployment
         # Copy base templates
-        base_template = os.path.join(TEMPLATE_KUBE_DIR, "sample-app-deployment.yaml")
         base_output = os.path.join(base_output_dir, "base", "deployment.yaml")
-        substitute_variables(base_template, base_output, values)
+        substitute_variables(DEPLOYMENT_TEMPLATE, base_output, values)
         
         # Copy kustomization templates
-        base_kustomize = os.path.join(TEMPLATE_KUBE_DIR, "kustomize", "base", "kustomization.yaml")
-        overlay_kustomize = os.path.join(TEMPLATE_KUBE_DIR, "kustomize", "overlays", "env", "kustomization.yaml")
-        
         base_kustomize_out = os.path.join(base_output_dir, "base", "kustomization.yaml")
         overlay_kustomize_out = os.path.join(base_output_dir, "overlays", env, "kustomization.yaml")
         
-        substitute_variables(base_kustomize, base_kustomize_out, values)
-        substitute_variables(overlay_kustomize, overlay_kustomize_out, values)
+        substitute_variables(KUSTOMIZE_BASE_TEMPLATE, base_kustomize_out, values)
+        substitute_variables(KUSTOMIZE_OVERLAY_TEMPLATE, overlay_kustomize_out, values)
         
     elif method == "argocd":
         # ArgoCD deployment
-        template_path = os.path.join(TEMPLATE_KUBE_DIR, "argocd", "application.yaml")
         output_path = os.path.join(base_output_dir, "argocd", "application.yaml")
-        substitute_variables(template_path, output_path, values)
+        substitute_variables(ARGOCD_TEMPLATE, output_path, values)
         
     elif method == "flux":
         # Flux deployment
-        template_path = os.path.join(TEMPLATE_KUBE_DIR, "flux", "deployment.yaml")
         output_path = os.path.join(base_output_dir, "flux", "deployment.yaml")
-        substitute_variables(template_path, output_path, values)
+        substitute_variables(FLUX_TEMPLATE, output_path, values)
     
     print(f"\nKubernetes configuration generated successfully in {base_output_dir}")
     print(f"Deployment method: {method.upper()}")
@@ -30,19 +30,6 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from mcp.server.fastmcp import FastMCP
 import yaml
 
-
-class _NoAliasDumper(yaml.Dumper):
-    """Custom YAML Dumper that never emits anchors or aliases.
-
-    Prevents PyYAML from collapsing shared object references (e.g. the same
-    ``branches`` list used in both ``push`` and ``pull_request`` triggers) into
-    anchor/alias pairs like ``&id001`` / ``*id001`` that are not supported by
-    GitHub Actions and confuse users.
-    """
-
-    def ignore_aliases(self, data):  # noqa: ARG002
-        return True
-
 # ---------------------------------------------------------------------------
 # Shared helpers
 # ---------------------------------------------------------------------------
@@ -158,19 +145,12 @@ def generate_github_actions_workflow(
             output_dir=tmp,
         )
 
-        env_config = {}
-        configs = {
-            "languages": scaffold_gha.generate_language_config(args.languages, env_config),
-            "kubernetes": scaffold_gha.generate_kubernetes_config(args.kubernetes, args.k8s_method, env_config),
-            "cicd": scaffold_gha.generate_cicd_config(env_config),
-            "build_tools": scaffold_gha.generate_build_tools_config(env_config),
-            "code_analysis": scaffold_gha.generate_code_analysis_config(env_config),
-            "devops_tools": scaffold_gha.generate_devops_tools_config(env_config),
-        }
+        configs = scaffold_gha.build_configs(args, {})
 
-        import yaml
+        # Serialise with the generator's own alias-free dumper so the MCP tool
+        # and the CLI emit identical workflow YAML.
         workflow_content = scaffold_gha.generate_workflow(args, {}, configs)
-        return yaml.dump(workflow_content, sort_keys=False, Dumper=_NoAliasDumper)
+        return scaffold_gha.dump_workflow(workflow_content)
 
 
 # ---------------------------------------------------------------------------
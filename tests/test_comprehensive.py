@@ -298,6 +298,182 @@ class TestScaffoldGHA:
         assert python_steps, "Expected Python build steps"
         assert go_steps, "Expected Go build steps"
 
+    def test_dependency_cache_steps_follow_checkout(self):
+        args = _gha_args(type="complete", languages="python,go")
+        configs = {
+            "languages": scaffold_gha.generate_language_config("python,go", {}),
+            "kubernetes": scaffold_gha.generate_kubernetes_config(False, "kubectl", {}),
+            "cicd": scaffold_gha.generate_cicd_config({}),
+            "build_tools": scaffold_gha.generate_build_tools_config({}),
+            "code_analysis": scaffold_gha.generate_code_analysis_config({}),
+            "devops_tools": scaffold_gha.generate_devops_tools_config({}),
+        }
+        wf = scaffold_gha.generate_workflow(args, {}, configs)
+        for job in ("build", "test"):
+            steps = wf["jobs"][job]["steps"]
+            assert steps[0]["uses"].startswith("actions/checkout")
+            cache_steps = [s for s in steps if s.get("uses") == "actions/cache@v4"]
+            assert [s["name"] for s in cache_steps] == ["Cache pip packages", "Cache Go modules"]
+            assert steps[1:3] == cache_steps
+        deploy_uses = [s.get("uses") for s in wf["jobs"]["deploy"]["steps"]]
+        assert "actions/cache@v4" not in deploy_uses
+
+    def test_argocd_syncs_all_apps_in_one_call(self):
+        args = _gha_args(type="deploy", kubernetes=True, k8s_method="argocd")
+        values = {"argocd_apps": ["api", "worker"]}
+        wf = scaffold_gha.generate_workflow(args, values, scaffold_gha.build_configs(args, {}))
+        step = wf["jobs"]["deploy"]["steps"][-1]
+        assert step["env"]["ARGOCD_APPS"] == "api worker"
+        assert "argocd app sync $ARGOCD_APPS --async" in step["run"]
+        assert step["env"]["ARGOCD_SERVER"] == "${{ secrets.ARGOCD_SERVER }}"
+        for apps, expected in (("web-app", "web-app"), ("api, worker", "api worker"),
+                               ([], "my-application"), ("", "my-application")):
+            wf = scaffold_gha.generate_workflow(args, {"argocd_apps": apps},
+                                                scaffold_gha.build_configs(args, {}))
+            assert wf["jobs"]["deploy"]["steps"][-1]["env"]["ARGOCD_APPS"] == expected
+
+    def test_workflow_is_plain_data(self):
+        for wf_type in ("complete", "reusable"):
+            args = _gha_args(type=wf_type, reusable=(wf_type == "reusable"), kubernetes=True)
+            wf = scaffold_gha.generate_workflow(args, {}, scaffold_gha.build_configs(args, {}))
+            json.dumps(wf)
+            yaml.safe_dump(wf)
+            # Editing one result must not leak into the shared step tables
+            wf["jobs"]["deploy"]["steps"][0]["name"] = "changed"
+            again = scaffold_gha.generate_workflow(args, {}, scaffold_gha.build_configs(args, {}))
+            assert again["jobs"]["deploy"]["steps"][0]["name"] == "Checkout code"
+
+    def test_concurrency_cancels_superseded_runs(self):
+        for wf_type, cancel in (("build", True), ("test", True),
+                                ("deploy", "${{ github.ref != 'refs/heads/main' }}"),
+                                ("complete", "${{ github.ref != 'refs/heads/main' }}")):
+            args = _gha_args(type=wf_type)
+            wf = scaffold_gha.generate_workflow(args, {}, scaffold_gha.build_configs(args, {}))
+            assert wf["concurrency"]["group"] == "${{ github.workflow }}-${{ github.ref }}"
+            assert wf["concurrency"]["cancel-in-progress"] == cancel
+        args = _gha_args(type="reusable", reusable=True)
+        assert "concurrency" not in scaffold_gha.generate_workflow(args, {}, scaffold_gha.build_configs(args, {}))
+
+    def test_triggers_skip_docs_only_changes(self):
+        args = _gha_args(type="build")
+        configs = scaffold_gha.build_configs(args, {})
+        on = scaffold_gha.generate_workflow(args, {}, configs)["on"]
+        assert list(on["push"]["paths-ignore"]) == ["**/*.md", "docs/**", ".gitignore"]
+        assert list(on["pull_request"]["paths-ignore"]) == ["**/*.md", "docs/**", ".gitignore"]
+        on = scaffold_gha.generate_workflow(args, {"paths_ignore": ["*.txt"]}, configs)["on"]
+        assert on["push"]["paths-ignore"] == ["*.txt"]
+
+    def test_container_only_on_jobs_that_run_tooling(self):
+        args = _gha_args(type="reusable", reusable=True)
+        jobs = scaffold_gha.generate_workflow(args, {}, scaffold_gha.build_configs(args, {}))["jobs"]
+        assert "container" not in jobs["build"]
+        assert "container" not in jobs["test"]
+        assert "container" in jobs["lint"]
+        assert "container" in jobs["deploy"]
+        args = _gha_args(type="complete")
+        jobs = scaffold_gha.generate_workflow(args, {}, scaffold_gha.build_configs(args, {}))["jobs"]
+        assert "container" in jobs["build"]
+        assert "container" not in jobs["deploy"]
+
+    def test_container_image_pinned_by_digest(self):
+        digest = "sha256:" + "a" * 64
+        args = _gha_args(type="complete", image="localhost:5000/org/devops-os:latest")
+        values = {"container_image_digest": digest}
+        wf = scaffold_gha.generate_workflow(args, values, scaffold_gha.build_configs(args, {}))
+        for name in ("build", "test"):
+            assert wf["jobs"][name]["container"]["image"] == f"localhost:5000/org/devops-os@{digest}"
+
+    def test_reusable_workflow_fans_out_before_deploy(self):
+        args = _gha_args(type="reusable", languages="python", reusable=True)
+        jobs = scaffold_gha.generate_workflow(args, {}, scaffold_gha.build_configs(args, {}))["jobs"]
+        assert "needs" not in jobs["build"]
+        assert "needs" not in jobs["test"]
+        assert "needs" not in jobs["lint"]
+        assert [s["name"] for s in jobs["lint"]["steps"][2:]] == ["SonarQube Analysis", "Run Pylint"]
+        assert jobs["deploy"]["needs"] == ["build", "test", "lint"]
+
+    def test_reusable_k8s_methods_are_gated_steps(self):
+        args = _gha_args(type="reusable", reusable=True, kubernetes=True)
+        steps = scaffold_gha.generate_workflow(args, {}, scaffold_gha.build_configs(args, {}))["jobs"]["deploy"]["steps"]
+        gated = {m: [s for s in steps if s.get("if", "").endswith(f"k8s_method == '{m}'")]
+                 for m in ("kubectl", "kustomize", "argocd", "flux")}
+        assert all(len(found) == 1 for found in gated.values())
+        assert not any("if [[" in s.get("run", "") for s in steps)
+        assert gated["argocd"][0]["env"]["ARGOCD_APPS"] == "my-application"
+
+    def test_reusable_workflow_caches_dependencies(self):
+        args = _gha_args(type="reusable", languages="python,javascript", reusable=True)
+        wf = scaffold_gha.generate_workflow(args, {}, scaffold_gha.build_configs(args, {}))
+        for job in ("build", "test"):
+            names = [s["name"] for s in wf["jobs"][job]["steps"][1:3]]
+            assert names == ["Cache pip packages", "Cache npm packages"]
+
+    def test_deploy_image_built_with_buildx_gha_cache(self):
+        for wf_type, secret in (("deploy", "REGISTRY_TOKEN"), ("reusable", "registry_token")):
+            args = _gha_args(type=wf_type, registry="quay.io")
+            wf = scaffold_gha.generate_workflow(args, {}, scaffold_gha.build_configs(args, {}))
+            steps = {s.get("uses", "").split("@")[0]: s for s in wf["jobs"]["deploy"]["steps"]}
+            assert "docker/setup-buildx-action" in steps
+            assert steps["docker/login-action"]["with"]["password"] == f"${{{{ secrets.{secret} }}}}"
+            push = steps["docker/build-push-action"]["with"]
+            assert push["tags"].startswith("quay.io/")
+            assert push["cache-from"] == "type=gha"
+            assert push["cache-to"] == "type=gha,mode=max"
+
+    def test_complete_jobs_match_standalone_workflows(self):
+        args = _gha_args(languages="python,java,javascript,go", kubernetes=True)
+        configs = scaffold_gha.build_configs(args, {})
+        complete = scaffold_gha.generate_complete_workflow(args, {}, configs)["jobs"]
+        build = scaffold_gha.generate_build_workflow(args, {}, configs)["jobs"]["build"]
+        test = scaffold_gha.generate_test_workflow(args, {}, configs)["jobs"]["test"]
+        deploy = scaffold_gha.generate_deploy_workflow(args, {}, configs)["jobs"]["deploy"]
+        assert complete["build"] == build
+        assert {k: v for k, v in complete["test"].items() if k != "needs"} == test
+        assert complete["deploy"]["steps"] == deploy["steps"]
+
+    def test_generated_workflows_do_not_share_steps(self):
+        args = _gha_args(type="build", matrix=True)
+        configs = scaffold_gha.build_configs(args, {})
+        first = scaffold_gha.generate_workflow(args, {}, configs)
+        second = scaffold_gha.generate_workflow(args, {}, configs)
+        first["jobs"]["build"]["steps"][0]["uses"] = "actions/checkout@v4"
+        first["jobs"]["build"]["strategy"]["matrix"]["arch"].append("riscv64")
+        assert second["jobs"]["build"]["steps"][0]["uses"] == "actions/checkout@v3"
+        assert second["jobs"]["build"]["strategy"]["matrix"]["arch"] == ["amd64", "arm64"]
+        yaml_str = scaffold_gha.dump_workflow(second)
+        assert yaml.safe_load(yaml_str)["jobs"]["build"]["strategy"]["matrix"]["arch"] == ["amd64", "arm64"]
+
+    def test_json_loaders_reuse_parse_until_file_changes(self, tmp_path):
+        env_file = tmp_path / "devcontainer.env.json"
+        env_file.write_text('{\n  // comment\n  "languages": {"go": true}\n}\n')
+        first = scaffold_gha.load_env_config(str(env_file))
+        assert first == {"languages": {"go": True}}
+        assert scaffold_gha.load_env_config(str(env_file)) is first
+        env_file.write_text('{"languages": {"go": false, "java": true}}')
+        assert scaffold_gha.load_env_config(str(env_file)) == {"languages": {"go": False, "java": True}}
+        assert scaffold_gha.load_custom_values(str(tmp_path / "missing.json")) == {}
+
+    def test_build_configs_prefers_env_config(self):
+        args = _gha_args(languages="java", kubernetes=True, k8s_method="flux")
+        env_config = {"cicd": {"docker": False}}
+        configs = scaffold_gha.build_configs(args, env_config)
+        assert set(configs) == {"languages", "kubernetes", "cicd", "build_tools",
+                                "code_analysis", "devops_tools"}
+        assert configs["languages"]["java"] is True
+        assert configs["kubernetes"]["flux"] is True
+        assert configs["cicd"] is env_config["cicd"]
+
+    def test_parse_arguments_reads_env_at_parse_time(self, monkeypatch):
+        monkeypatch.setenv("DEVOPS_OS_GHA_NAME", "from-env")
+        monkeypatch.setenv("DEVOPS_OS_GHA_MATRIX", "yes")
+        args = scaffold_gha.parse_arguments(["--branches", "main, dev"])
+        assert args.name == "from-env"
+        assert args.matrix is True
+        assert args.kubernetes is False
+        assert args.branch_list == ["main", "dev"]
+        args = scaffold_gha.parse_arguments(["--name", "from-cli"])
+        assert args.name == "from-cli"
+
     def test_cli_gha_scaffold_via_module(self):
         """Test CLI invocation of scaffold gha via module."""
         with tempfile.TemporaryDirectory() as tmp:
@@ -346,7 +522,7 @@ class TestScaffoldGHA:
             "devops_tools": scaffold_gha.generate_devops_tools_config({}),
         }
         wf = scaffold_gha.generate_workflow(args, {}, configs)
-        yaml_str = yaml.dump(wf, sort_keys=False, Dumper=scaffold_gha._NoAliasDumper)
+        yaml_str = scaffold_gha.dump_workflow(wf)
         assert "&id" not in yaml_str, "YAML output must not contain anchors (&id...)"
         assert "*id" not in yaml_str, "YAML output must not contain aliases (*id...)"
         # Also verify both push and pull_request branches are present
@@ -366,7 +542,7 @@ class TestScaffoldGHA:
             "devops_tools": scaffold_gha.generate_devops_tools_config({}),
         }
         wf = scaffold_gha.generate_workflow(args, {}, configs)
-        yaml_str = yaml.dump(wf, sort_keys=False, Dumper=scaffold_gha._NoAliasDumper)
+        yaml_str = scaffold_gha.dump_workflow(wf)
         assert "&id" not in yaml_str, "YAML output must not contain anchors (&id...)"
         assert "*id" not in yaml_str, "YAML output must not contain aliases (*id...)"
 
@@ -490,6 +666,127 @@ class TestScaffoldJenkins:
         content = scaffold_jenkins.generate_pipeline(args, configs)
         assert "cleanWs()" in content
 
+    def test_analysis_steps_follow_code_analysis_config(self):
+        args = _jenkins_args(type="test", languages="python,java")
+        configs = {
+            "languages": scaffold_jenkins.generate_language_config("python,java", {}),
+            "kubernetes": scaffold_jenkins.generate_kubernetes_config(False, "kubectl", {}),
+            "code_analysis": {"pylint": False, "checkstyle": True},
+        }
+        content = scaffold_jenkins.generate_pipeline(args, configs)
+        assert "pylint" not in content
+        assert "mvn checkstyle:checkstyle" in content
+        assert content.index("mvn -B test") < content.index("mvn checkstyle:checkstyle")
+
+    def test_parse_arguments_reads_env_at_parse_time(self, monkeypatch):
+        monkeypatch.setenv("DEVOPS_OS_JENKINS_NAME", "from-env")
+        monkeypatch.setenv("DEVOPS_OS_JENKINS_KUBERNETES", "Yes")
+        args = scaffold_jenkins.parse_arguments(["--type", "build"])
+        assert args.name == "from-env"
+        assert args.kubernetes is True
+        assert args.parameters is False
+        args = scaffold_jenkins.parse_arguments(["--name", "from-cli", "--type", "parameterized"])
+        assert args.name == "from-cli"
+        assert args.parameters is True
+
+    def test_batch_mode_generates_each_entry(self, tmp_path, monkeypatch):
+        import io
+        specs = [
+            {"type": "build", "languages": "go", "output": str(tmp_path / "build" / "Jenkinsfile")},
+            {"type": "deploy", "kubernetes": True, "k8s_method": "flux",
+             "output": str(tmp_path / "deploy" / "Jenkinsfile")},
+        ]
+        monkeypatch.setattr(sys, "argv", ["scaffold_jenkins", "--batch"])
+        monkeypatch.setattr(sys, "stdin", io.StringIO(json.dumps(specs)))
+        scaffold_jenkins.main()
+        build = (tmp_path / "build" / "Jenkinsfile").read_text()
+        deploy = (tmp_path / "deploy" / "Jenkinsfile").read_text()
+        assert "go build" in build and "stage('Deploy')" not in build
+        assert "flux reconcile" in deploy and "stage('Build')" not in deploy
+
+    def test_batch_mode_parses_every_entry_before_writing(self, tmp_path, monkeypatch):
+        import io
+        first = tmp_path / "a" / "Jenkinsfile"
+        specs = [{"type": "build", "output": str(first)},
+                 {"type": "bogus", "output": str(tmp_path / "b" / "Jenkinsfile")}]
+        monkeypatch.setattr(sys, "argv", ["scaffold_jenkins", "--batch"])
+        monkeypatch.setattr(sys, "stdin", io.StringIO(json.dumps(specs)))
+        with pytest.raises(SystemExit) as exc:
+            scaffold_jenkins.main()
+        assert exc.value.code != 0
+        assert not first.exists()
+
+    def test_batch_mode_reads_string_flags(self, tmp_path, monkeypatch):
+        import io
+        output = tmp_path / "Jenkinsfile"
+        specs = [{"type": "deploy", "kubernetes": "yes", "parameters": "false", "output": str(output)}]
+        monkeypatch.setattr(sys, "argv", ["scaffold_jenkins", "--batch"])
+        monkeypatch.setattr(sys, "stdin", io.StringIO(json.dumps(specs)))
+        scaffold_jenkins.main()
+        jenkinsfile = output.read_text()
+        assert "kubectl apply" in jenkinsfile
+        assert "booleanParam(name: 'KUBERNETES_DEPLOY'" not in jenkinsfile
+
+    def test_batch_mode_joins_list_values(self, tmp_path, monkeypatch):
+        import io
+        output = tmp_path / "Jenkinsfile"
+        specs = [{"type": "build", "languages": ["python", "go"], "output": str(output)}]
+        monkeypatch.setattr(sys, "argv", ["scaffold_jenkins", "--batch"])
+        monkeypatch.setattr(sys, "stdin", io.StringIO(json.dumps(specs)))
+        scaffold_jenkins.main()
+        jenkinsfile = output.read_text()
+        assert "PYTHON_ENABLED = params.PYTHON_ENABLED ?: true" in jenkinsfile
+        assert "GO_ENABLED = params.GO_ENABLED ?: true" in jenkinsfile
+
+    @pytest.mark.parametrize("stdin, message", [
+        ("not json", "not valid JSON"),
+        ('{"type": "build"}', "expects a JSON array"),
+        ("[1]", "entry 0 must be a JSON object"),
+        ('[{"type": "build"}, {"languages": {"python": true}}]', "entry 1 option 'languages'"),
+        ('[{"kubernetes": 1}]', "entry 0 flag 'kubernetes' must be true or false"),
+    ])
+    def test_batch_mode_rejects_bad_input(self, tmp_path, monkeypatch, capsys, stdin, message):
+        import io
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(sys, "argv", ["scaffold_jenkins", "--batch"])
+        monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+        with pytest.raises(SystemExit) as exc:
+            scaffold_jenkins.main()
+        assert exc.value.code == 1
+        assert message in capsys.readouterr().out
+        assert not (tmp_path / "Jenkinsfile").exists()
+
+    def test_identical_pipelines_render_once(self):
+        configs = {
+            "languages": scaffold_jenkins.generate_language_config("python", {}),
+            "kubernetes": scaffold_jenkins.generate_kubernetes_config(False, "kubectl", {}),
+        }
+        first = scaffold_jenkins.generate_pipeline(_jenkins_args(name="svc-a", image="img:memo"), configs)
+        hits = scaffold_jenkins._render_pipeline.cache_info().hits
+        second = scaffold_jenkins.generate_pipeline(_jenkins_args(name="svc-b", image="img:memo"), configs)
+        assert second == first
+        assert scaffold_jenkins._render_pipeline.cache_info().hits == hits + 1
+        other = scaffold_jenkins.generate_pipeline(_jenkins_args(image="img:other"), configs)
+        assert "img:other" in other and "img:memo" not in other
+
+    def test_language_list_tolerates_spaces(self):
+        config = scaffold_jenkins.generate_language_config("python, go", {})
+        assert config == {"python": True, "java": False, "javascript": False, "go": True}
+
+    def test_language_list_is_case_insensitive(self):
+        config = scaffold_jenkins.generate_language_config("Python,JAVA", {})
+        assert config == {"python": True, "java": True, "javascript": False, "go": False}
+
+    def test_custom_values_reparsed_only_when_file_changes(self, tmp_path):
+        values_file = tmp_path / "values.json"
+        values_file.write_text('{"image_name": "app"}')
+        first = scaffold_jenkins.load_custom_values(str(values_file))
+        assert first == {"image_name": "app"}
+        assert scaffold_jenkins.load_custom_values(str(values_file)) is first
+        values_file.write_text('{"image_name": "service"}')
+        assert scaffold_jenkins.load_custom_values(str(values_file)) == {"image_name": "service"}
+        assert scaffold_jenkins.load_env_config(str(tmp_path)) == {}
+
     def test_cli_jenkins_scaffold_via_module(self):
         with tempfile.TemporaryDirectory() as tmp:
             out = os.path.join(tmp, "Jenkinsfile")
@@ -935,6 +1232,32 @@ class TestScaffoldSREExtended:
                 assert (Path(tmp) / fname).exists(), f"Missing: {fname}"
 
 
+# ===========================================================================
+# Kubernetes: k8s-config-generator
+# ===========================================================================
+
+def _load_k8s_generator():
+    """Import kubernetes/k8s-config-generator.py, whose name is not a valid module name."""
+    import importlib.util
+    path = os.path.join(os.path.dirname(__file__), "..", "kubernetes", "k8s-config-generator.py")
+    spec = importlib.util.spec_from_file_location("k8s_config_generator", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestK8sConfigGenerator:
+    """Tests for the Kubernetes manifest template substitution."""
+
+    def test_unknown_placeholders_pass_through_unchanged(self, tmp_path):
+        k8s = _load_k8s_generator()
+        template = tmp_path / "manifest.yaml"
+        template.write_text("app: $APP_NAME/${APP_NAME}\nhome: $HOME ${HOME} $$HOME {literal}\n")
+        output = tmp_path / "out.yaml"
+        k8s.substitute_variables(str(template), str(output), {"APP_NAME": "web"})
+        assert output.read_text() == "app: web/web\nhome: $HOME ${HOME} $HOME {literal}\n"
+
+
 # ===========================================================================
 # MCP Server: extended coverage
 # ===========================================================================